@@ -39,6 +39,7 @@ from .enums import (
     DataFormat,
     Device,
     Engine,
+    Engines,
     GoogleSearchType,
     GoogleTbm,
     OutputFormat,
@@ -97,6 +98,7 @@ __all__ = [
     "ThordataClient",
     "AsyncThordataClient",
     "Engine",
+    "Engines",
     "GoogleSearchType",
     "BingSearchType",
     "ProxyType",
@@ -7,9 +7,12 @@ optimizations to improve SDK performance.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
 from typing import Any, TypeVar
 
 T = TypeVar("T")
@@ -20,6 +23,7 @@ class SimpleCache:
     Simple in-memory cache with TTL (Time To Live).
 
     Useful for caching API responses that don't change frequently.
+    Safe to share between threads.
     """
 
     def __init__(self, ttl: int = 300) -> None:
@@ -31,6 +35,14 @@ class SimpleCache:
         """
         self._cache: dict[str, tuple[Any, float]] = {}
         self._ttl = ttl
+        self._lock = threading.Lock()
+        # Bumped by clear(), so writes computed before a clear can be dropped
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented on every `clear()`; pass it back to `set()`."""
+        return self._generation
 
     def get(self, key: str) -> Any | None:
         """
@@ -42,29 +54,38 @@ class SimpleCache:
         Returns:
             Cached value or None if not found/expired.
         """
-        if key not in self._cache:
-            return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
 
-        value, timestamp = self._cache[key]
-        if time.time() - timestamp > self._ttl:
-            del self._cache[key]
-            return None
+            value, timestamp = entry
+            if time.time() - timestamp >= self._ttl:
+                del self._cache[key]
+                return None
 
-        return value
+            return value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, *, generation: int | None = None) -> None:
         """
         Set value in cache.
 
         Args:
             key: Cache key.
             value: Value to cache.
+            generation: `generation` read before the value was fetched. If the
+                cache has been cleared since, the value is stale and not stored.
         """
-        self._cache[key] = (value, time.time())
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._cache[key] = (value, time.time())
 
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
 
     def invalidate(self, key: str) -> None:
         """
@@ -73,7 +94,93 @@ class SimpleCache:
         Args:
             key: Cache key to invalidate.
         """
-        self._cache.pop(key, None)
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one.
+
+    While a call for ``key`` is in flight, other threads asking for the same
+    key wait for and share its result instead of issuing their own request.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies calls that may share a result.
+            func: Zero-argument callable performing the work.
+
+        Returns:
+            The result of ``func`` (possibly from another thread's call).
+        """
+        with self._lock:
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if fut is None:
+                fut = self._inflight[key] = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """
+    Async counterpart of :class:`SingleFlight` for tasks on one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``func()`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies calls that may share a result.
+            func: Zero-argument coroutine function performing the work.
+
+        Returns:
+            The result of ``func()`` (possibly from another task's call).
+        """
+        fut = self._inflight.get(key)
+        if fut is not None:
+            # Shield so a cancelled waiter doesn't cancel the shared call
+            return await asyncio.shield(fut)
+
+        fut = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await func()
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; the owner re-raises it below
+            raise
+        except BaseException:
+            fut.cancel()
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
 
 def cached(ttl: int = 300, key_func: Callable[..., str] | None = None):
@@ -168,4 +275,10 @@ class BatchProcessor:
         return results
 
 
-__all__ = ["SimpleCache", "cached", "BatchProcessor"]
+__all__ = [
+    "SimpleCache",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "cached",
+    "BatchProcessor",
+]
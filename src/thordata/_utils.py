@@ -10,10 +10,20 @@ import base64
 import json
 import logging
 import platform
-from typing import Any
+from typing import Any, Callable
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup (pip install thordata-sdk[fast-json])
+    _orjson = None
 
 logger = logging.getLogger(__name__)
 
+# JSON decoder for response bodies: orjson when installed, else the stdlib.
+json_loads: Callable[[str | bytes], Any] = (
+    _orjson.loads if _orjson is not None else json.loads
+)
+
 
 def html_to_markdown(html: str, max_length: int | None = None) -> str:
     """
@@ -102,6 +112,19 @@ def parse_json_response(data: Any) -> Any:
     return data
 
 
+def response_json(response: Any) -> Any:
+    """
+    Decode the JSON body of a ``requests`` response.
+
+    Uses orjson on the raw bytes when it is installed, skipping the text
+    decode step of ``response.json()``; falls back to ``response.json()``.
+    """
+    content = getattr(response, "content", None)
+    if _orjson is not None and isinstance(content, bytes):
+        return _orjson.loads(content)
+    return response.json()
+
+
 def decode_base64_image(png_str: str) -> bytes:
     """
     Decode a base64-encoded PNG image.
@@ -11,6 +11,7 @@ import asyncio
 import logging
 import os
 from datetime import date
+from functools import cached_property
 from typing import Any
 from urllib.parse import quote
 
@@ -36,6 +37,7 @@ from ._utils import (
     build_public_api_headers,
     decode_base64_image,
     extract_error_message,
+    json_loads,
     parse_json_response,
 )
 from .async_unlimited import AsyncUnlimitedNamespace
@@ -108,6 +110,7 @@ class AsyncThordataClient:
         universalapi_base_url: str | None = None,
         web_scraper_api_base_url: str | None = None,
         locations_base_url: str | None = None,
+        cache_ttl: int = 10,
     ) -> None:
         self.scraper_token = scraper_token
         self.public_token = public_token
@@ -116,6 +119,8 @@ class AsyncThordataClient:
         self._proxy_host = proxy_host
         self._proxy_port = proxy_port
         self._retry_config = retry_config or RetryConfig()
+        # TTL (seconds) for read-only listings such as unlimited servers
+        self._cache_ttl = cache_ttl
 
         self._api_timeout = api_timeout
 
@@ -171,10 +176,11 @@ class AsyncThordataClient:
         self._download_url = f"{web_scraper_api_base}/tasks-download"
         self._list_url = f"{web_scraper_api_base}/tasks-list"
         self._locations_base_url = locations_base
+        # Public API root (.../api -> shared by account and unlimited endpoints)
+        self._api_base = locations_base.replace("/locations", "")
 
-        shared_api_base = locations_base.replace("/locations", "")
-        self._usage_stats_url = f"{shared_api_base}/account/usage-statistics"
-        self._proxy_users_url = f"{shared_api_base}/proxy-users"
+        self._usage_stats_url = f"{self._api_base}/account/usage-statistics"
+        self._proxy_users_url = f"{self._api_base}/proxy-users"
 
         whitelist_base = os.getenv(
             "THORDATA_WHITELIST_BASE_URL", "https://openapi.thordata.com/api"
@@ -187,14 +193,31 @@ class AsyncThordataClient:
         self._proxy_list_url = f"{proxy_api_base}/proxy/proxy-list"
         self._proxy_expiration_url = f"{proxy_api_base}/proxy/expiration-time"
 
-        # Namespaces
-        self.serp = AsyncSerpNamespace(self)
-        self.unlimited = AsyncUnlimitedNamespace(self)
-        # New unified namespaces
-        self.universal = UniversalNamespace(self)
-        self.scraper = WebScraperNamespace(self)
-        self.account = AccountNamespace(self)
-        self.proxy = ProxyNamespace(self)
+    # Namespaces (built on first access)
+    @cached_property
+    def serp(self) -> AsyncSerpNamespace:
+        return AsyncSerpNamespace(self)
+
+    @cached_property
+    def unlimited(self) -> AsyncUnlimitedNamespace:
+        return AsyncUnlimitedNamespace(self)
+
+    # New unified namespaces
+    @cached_property
+    def universal(self) -> UniversalNamespace:
+        return UniversalNamespace(self)
+
+    @cached_property
+    def scraper(self) -> WebScraperNamespace:
+        return WebScraperNamespace(self)
+
+    @cached_property
+    def account(self) -> AccountNamespace:
+        return AccountNamespace(self)
+
+    @cached_property
+    def proxy(self) -> ProxyNamespace:
+        return ProxyNamespace(self)
 
     async def __aenter__(self) -> AsyncThordataClient:
         await self._http._ensure_session()
@@ -327,19 +350,21 @@ class AsyncThordataClient:
         )
         return await self.serp_search_advanced(request)
 
-    async def serp_search_advanced(self, request: SerpRequest) -> dict[str, Any]:
+    async def serp_search_advanced(
+        self, request: SerpRequest | SerpTypedRequest
+    ) -> dict[str, Any]:
         if not self.scraper_token:
             raise ThordataConfigError("scraper_token is required for SERP API")
         payload = request.to_payload()
         headers = build_auth_headers(self.scraper_token, mode=self._auth_mode)
-        logger.info(f"Async SERP: {request.engine} - {request.query}")
+        logger.info(f"Async SERP: {request.engine} - {getattr(request, 'query', '')}")
 
         response = await self._http.request(
             "POST", self._serp_url, data=payload, headers=headers
         )
 
         if request.output_format.lower() == "json":
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             if isinstance(data, dict):
                 code = data.get("code")
                 if code is not None and code != 200:
@@ -357,7 +382,7 @@ class AsyncThordataClient:
         """
         Execute a strongly-typed SERP request (async).
         """
-        return await self.serp_search_advanced(request.to_serp_request())
+        return await self.serp_search_advanced(request)
 
     async def serp_batch_search(
         self,
@@ -521,7 +546,7 @@ class AsyncThordataClient:
         if response.status != 200:
             # Try to get error message from response
             try:
-                resp_json = await response.json()
+                resp_json = await response.json(loads=json_loads)
                 if isinstance(resp_json, dict):
                     code = resp_json.get("code")
                     msg = extract_error_message(resp_json)
@@ -542,7 +567,7 @@ class AsyncThordataClient:
 
         # Process response with improved error handling
         try:
-            resp_json = await response.json()
+            resp_json = await response.json(loads=json_loads)
         except ValueError:
             # If not JSON, check if it's a valid HTML/text response
             # This can happen when js_render=False and API returns raw HTML
@@ -929,7 +954,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "POST", self._builder_url, data=payload, headers=headers
         )
-        data = await response.json(content_type=None)
+        data = await response.json(content_type=None, loads=json_loads)
         if data.get("code") != 200:
             raise_for_code(
                 f"Task creation failed: {extract_error_message(data)}",
@@ -969,7 +994,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "POST", self._video_builder_url, data=payload, headers=headers
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code(
                 f"Video task failed: {extract_error_message(data)}",
@@ -984,7 +1009,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "POST", self._status_url, data={"tasks_ids": task_id}, headers=headers
         )
-        data = await response.json(content_type=None)
+        data = await response.json(content_type=None, loads=json_loads)
 
         if isinstance(data, dict):
             code = data.get("code")
@@ -1016,7 +1041,7 @@ class AsyncThordataClient:
             data={"tasks_id": task_id, "type": file_type},
             headers=headers,
         )
-        data = await response.json(content_type=None)
+        data = await response.json(content_type=None, loads=json_loads)
         if data.get("code") == 200 and data.get("data"):
             return data["data"]["download"]
         raise_for_code("Get result failed", code=data.get("code"), payload=data)
@@ -1031,7 +1056,7 @@ class AsyncThordataClient:
             data={"page": str(page), "size": str(size)},
             headers=headers,
         )
-        data = await response.json(content_type=None)
+        data = await response.json(content_type=None, loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("List tasks failed", code=data.get("code"), payload=data)
         return data.get("data", {"count": 0, "list": []})
@@ -1116,31 +1141,29 @@ class AsyncThordataClient:
             "to_date": to_date,
         }
         response = await self._http.request("GET", self._usage_stats_url, params=params)
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Usage error", code=data.get("code"), payload=data)
         return UsageStatistics.from_dict(data.get("data", data))
 
     async def get_traffic_balance(self) -> float:
         self._require_public_credentials()
-        api_base = self._locations_base_url.replace("/locations", "")
         params = {"token": str(self.public_token), "key": str(self.public_key)}
         response = await self._http.request(
-            "GET", f"{api_base}/account/traffic-balance", params=params
+            "GET", f"{self._api_base}/account/traffic-balance", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Balance error", code=data.get("code"), payload=data)
         return float(data.get("data", {}).get("traffic_balance", 0))
 
     async def get_wallet_balance(self) -> float:
         self._require_public_credentials()
-        api_base = self._locations_base_url.replace("/locations", "")
         params = {"token": str(self.public_token), "key": str(self.public_key)}
         response = await self._http.request(
-            "GET", f"{api_base}/account/wallet-balance", params=params
+            "GET", f"{self._api_base}/account/wallet-balance", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Balance error", code=data.get("code"), payload=data)
         return float(data.get("data", {}).get("balance", 0))
@@ -1170,7 +1193,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "GET", f"{self._proxy_users_url}/usage-statistics", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Get usage failed", code=data.get("code"), payload=data)
         return data.get("data", [])
@@ -1188,7 +1211,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "GET", f"{self._proxy_users_url}/user-list", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("List users error", code=data.get("code"), payload=data)
         return ProxyUserList.from_dict(data.get("data", data))
@@ -1217,7 +1240,7 @@ class AsyncThordataClient:
             data=payload,
             headers=headers,
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Create user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1258,7 +1281,7 @@ class AsyncThordataClient:
             data=payload,
             headers=headers,
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Update user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1276,7 +1299,7 @@ class AsyncThordataClient:
             data=payload,
             headers=headers,
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Delete user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1298,7 +1321,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "POST", f"{self._whitelist_url}/add-ip", data=payload, headers=headers
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Add whitelist failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1313,7 +1336,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "POST", f"{self._whitelist_url}/delete-ip", data=payload, headers=headers
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code(
                 "Delete whitelist failed", code=data.get("code"), payload=data
@@ -1333,7 +1356,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "GET", f"{self._whitelist_url}/ip-list", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("List whitelist failed", code=data.get("code"), payload=data)
 
@@ -1363,7 +1386,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "GET", f"{self._locations_base_url}/{endpoint}", params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
 
         if isinstance(data, dict):
             if data.get("code") != 200:
@@ -1417,7 +1440,7 @@ class AsyncThordataClient:
             "proxy_type": str(proxy_type),
         }
         response = await self._http.request("GET", self._proxy_list_url, params=params)
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code(
                 "List proxy servers error", code=data.get("code"), payload=data
@@ -1445,7 +1468,7 @@ class AsyncThordataClient:
         response = await self._http.request(
             "GET", self._proxy_expiration_url, params=params
         )
-        data = await response.json()
+        data = await response.json(loads=json_loads)
         if data.get("code") != 200:
             raise_for_code("Get expiration error", code=data.get("code"), payload=data)
         return data.get("data", data)
@@ -1496,7 +1519,7 @@ class AsyncThordataClient:
         )
 
         if return_type == "json":
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             if isinstance(data, dict):
                 if data.get("code") in (0, 200):
                     raw_list = data.get("data") or []
@@ -1511,7 +1534,7 @@ class AsyncThordataClient:
             text = text.strip()
             if text.startswith("{") and "code" in text:
                 try:
-                    err_data = await response.json()
+                    err_data = await response.json(loads=json_loads)
                     raise_for_code(
                         "Extract IPs failed",
                         code=err_data.get("code"),
@@ -5,21 +5,38 @@ Async interface for Unlimited Residential Proxy management.
 from __future__ import annotations
 
 import asyncio
+import copy
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
-from ._utils import build_public_api_headers, extract_error_message
+from ._performance import AsyncSingleFlight, SimpleCache
+from ._utils import build_public_api_headers, extract_error_message, json_loads
 from .exceptions import (
     ThordataNetworkError,
     ThordataTimeoutError,
     raise_for_code,
 )
+from .unlimited import _LIST_BOUND_USERS, _SERVER_LIST, _endpoint_urls
 
 if TYPE_CHECKING:
     from .async_client import AsyncThordataClient
 
 
+# Namespace methods that run_actions_batch may dispatch to
+_BATCH_ACTIONS = frozenset(
+    {
+        "restart_server",
+        "renew",
+        "upgrade",
+        "list_bound_users",
+        "bind_user",
+        "unbind_user",
+    }
+)
+
+
 class AsyncUnlimitedNamespace:
     """
     Async Namespace for Unlimited Residential Proxy operations.
@@ -27,11 +44,33 @@ class AsyncUnlimitedNamespace:
 
     def __init__(self, client: AsyncThordataClient):
         self._client = client
-        self._api_base = client._locations_base_url.replace("/locations", "")
+        # Base URL for unlimited endpoints (the public API root, .../api)
+        self._api_base = client._api_base
+        self._urls = _endpoint_urls(self._api_base)
+        # (credentials, headers) pair, replaced as a whole when creds change
+        self._headers_cache: tuple[tuple[str, str], dict[str, str]] | None = None
+        # Short-lived cache for read-only listings; cleared by any POST action
+        self._cache = SimpleCache(ttl=client._cache_ttl)
+        # Concurrent cache misses share one in-flight listing request
+        self._inflight = AsyncSingleFlight()
 
-    async def list_servers(self) -> list[dict[str, Any]]:
+    async def list_servers(
+        self, *, force_refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """Get the list of unlimited proxy servers."""
         self._client._require_public_credentials()
+        key = self._cache_key("servers")
+        cached = None if force_refresh else self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        # Concurrent callers share one fetch; each gets its own copy.
+        return copy.deepcopy(
+            await self._inflight.do(key, partial(self._fetch_servers, key))
+        )
+
+    async def _fetch_servers(self, key: str) -> list[dict[str, Any]]:
+        # Read first: a clear() during the request means the result may be stale
+        generation = self._cache.generation
         params = {
             "token": self._client.public_token or "",
             "key": self._client.public_key or "",
@@ -39,22 +78,25 @@ class AsyncUnlimitedNamespace:
 
         try:
             async with self._client._get_session().get(
-                f"{self._api_base}/unlimited/server-list",
+                self._urls[_SERVER_LIST],
                 params=params,
                 timeout=self._client._api_timeout,
             ) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
                 if isinstance(data, dict):
-                    if data.get("code") != 200:
+                    code = data.get("code")
+                    if code != 200:
                         msg = extract_error_message(data)
                         raise_for_code(
                             f"List servers failed: {msg}",
-                            code=data.get("code"),
+                            code=code,
                             payload=data,
                         )
-                    return data.get("data") or []
+                    servers = data.get("data") or []
+                    self._cache.set(key, copy.deepcopy(servers), generation=generation)
+                    return servers
                 return []
 
         except aiohttp.ClientError as e:
@@ -78,9 +120,41 @@ class AsyncUnlimitedNamespace:
             {"plan_name": plan_name, "target_plan": target_plan},
         )
 
-    async def list_bound_users(self, ip: str) -> list[dict[str, Any]]:
-        data = await self._post_action("/get_unlimited_servers_bind_user", {"ip": ip})
-        return data.get("list") or [] if isinstance(data, dict) else []
+    async def list_bound_users(
+        self, ip: str, *, force_refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        key = self._cache_key(f"bound:{ip}")
+        cached = None if force_refresh else self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        generation = self._cache.generation
+        data = await self._post_action(_LIST_BOUND_USERS, {"ip": ip})
+        users = data.get("list") or [] if isinstance(data, dict) else []
+        # The cache keeps its own copy, so callers may mutate what they get.
+        self._cache.set(key, copy.deepcopy(users), generation=generation)
+        return users
+
+    async def list_bound_users_batch(
+        self, ips: list[str], *, concurrency: int = 10
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        List bound users for many server IPs concurrently.
+
+        Args:
+            ips: Server IPs to query.
+            concurrency: Maximum number of concurrent requests (1-20).
+
+        Returns:
+            Mapping of IP -> bound users, in input order. The first failing
+            lookup raises.
+        """
+        sem = asyncio.Semaphore(min(max(concurrency, 1), 20))
+
+        async def _one(ip: str) -> list[dict[str, Any]]:
+            async with sem:
+                return await self.list_bound_users(ip)
+
+        return dict(zip(ips, await asyncio.gather(*map(_one, ips))))
 
     async def bind_user(self, ip: str, username: str) -> dict[str, Any]:
         return await self._post_action(
@@ -92,32 +166,154 @@ class AsyncUnlimitedNamespace:
             "/del_unlimited_servers_bind_user", {"ip": ip, "username": username}
         )
 
+    async def bind_users_batch(
+        self, pairs: list[tuple[str, str]], *, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Bind many sub-users concurrently.
+
+        Args:
+            pairs: (ip, username) pairs to bind.
+            concurrency: Maximum number of concurrent requests (1-20).
+
+        Returns:
+            One result per pair, in input order, each containing 'index', 'ok',
+            'ip', 'username', and 'output' or 'error'.
+        """
+        return await self._users_batch(
+            "/add_unlimited_servers_bind_user", pairs, concurrency
+        )
+
+    async def unbind_users_batch(
+        self, pairs: list[tuple[str, str]], *, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """Unbind many sub-users concurrently. See `bind_users_batch`."""
+        return await self._users_batch(
+            "/del_unlimited_servers_bind_user", pairs, concurrency
+        )
+
+    async def run_actions_batch(
+        self, actions: list[dict[str, Any]], *, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Run a mix of unlimited actions concurrently.
+
+        Each action item should have:
+            - "action": one of restart_server, renew, upgrade,
+              list_bound_users, bind_user, unbind_user
+            - "params": dict of keyword arguments for that method
+
+        Args:
+            actions: Action items to run.
+            concurrency: Maximum number of concurrent requests (1-20).
+
+        Returns:
+            One result per item, in input order, each containing 'index',
+            'action', 'ok', and 'output' or 'error'.
+        """
+        sem = asyncio.Semaphore(min(max(concurrency, 1), 20))
+
+        async def _one(i: int, item: dict[str, Any]) -> dict[str, Any]:
+            action = str(item.get("action", "")).strip()
+            params = item.get("params") or {}
+            result: dict[str, Any] = {"index": i, "action": action}
+
+            if action not in _BATCH_ACTIONS:
+                message = f"Unknown action: {action!r}"
+            elif not isinstance(params, dict):
+                message = "params must be a dict"
+            else:
+                message = ""
+            if message:
+                result.update(
+                    ok=False,
+                    error={"type": "validation_error", "message": message},
+                )
+                return result
+
+            try:
+                async with sem:
+                    output = await getattr(self, action)(**params)
+                result.update(ok=True, output=output)
+            except Exception as e:
+                result.update(
+                    ok=False,
+                    error={"type": type(e).__name__, "message": str(e)},
+                )
+            return result
+
+        return await asyncio.gather(*[_one(i, a) for i, a in enumerate(actions)])
+
+    async def _users_batch(
+        self, endpoint: str, pairs: list[tuple[str, str]], concurrency: int
+    ) -> list[dict[str, Any]]:
+        concurrency = min(max(concurrency, 1), 20)
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(i: int, ip: str, username: str) -> dict[str, Any]:
+            result: dict[str, Any] = {"index": i, "ip": ip, "username": username}
+            try:
+                async with sem:
+                    output = await self._post_action(
+                        endpoint, {"ip": ip, "username": username}
+                    )
+                result.update(ok=True, output=output)
+            except Exception as e:
+                result.update(
+                    ok=False,
+                    error={"type": type(e).__name__, "message": str(e)},
+                )
+            return result
+
+        return await asyncio.gather(
+            *[_one(i, ip, username) for i, (ip, username) in enumerate(pairs)]
+        )
+
+    def _cache_key(self, name: str) -> str:
+        # Listings belong to one account, so entries are scoped to the
+        # client's current public credentials.
+        client = self._client
+        return f"{name}:{client.public_token or ''}:{client.public_key or ''}"
+
+    def _public_headers(self) -> dict[str, str]:
+        # Rebuilt only when the client's public credentials change.
+        creds = (self._client.public_token or "", self._client.public_key or "")
+        cached = self._headers_cache
+        if cached is None or cached[0] != creds:
+            # Swapped in with one assignment, so batch worker threads never
+            # see new credentials paired with old or empty headers.
+            cached = (creds, build_public_api_headers(*creds))
+            self._headers_cache = cached
+        return cached[1]
+
     async def _post_action(
         self, endpoint: str, payload: dict[str, Any]
     ) -> dict[str, Any]:
         self._client._require_public_credentials()
-        headers = build_public_api_headers(
-            self._client.public_token or "", self._client.public_key or ""
-        )
+        headers = self._public_headers()
 
         try:
             async with self._client._get_session().post(
-                f"{self._api_base}{endpoint}",
+                self._urls[endpoint],
                 data=payload,
                 headers=headers,
                 timeout=self._client._api_timeout,
             ) as response:
                 response.raise_for_status()
-                data = await response.json()
+                data = await response.json(loads=json_loads)
 
-                if data.get("code") != 200:
+                code = data.get("code")
+                if code != 200:
                     msg = extract_error_message(data)
                     raise_for_code(
                         f"Action {endpoint} failed: {msg}",
-                        code=data.get("code"),
+                        code=code,
                         payload=data,
                     )
 
+                if endpoint != _LIST_BOUND_USERS:
+                    # Servers/bindings may have changed; drop cached listings.
+                    self._cache.clear()
                 return data.get("data", {})
 
         except asyncio.TimeoutError as e:
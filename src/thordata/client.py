@@ -7,13 +7,13 @@ Thordata's proxy network, SERP API, Universal Scraping API, and Web Scraper API.
 
 from __future__ import annotations
 
-import base64
 import hashlib
 import logging
 import os
 import socket
 import ssl
 from datetime import date
+from functools import cached_property
 from typing import Any, cast
 from urllib.parse import urlencode, urlparse
 
@@ -43,6 +43,7 @@ from ._utils import (
     decode_base64_image,
     extract_error_message,
     parse_json_response,
+    response_json,
 )
 from .constants import (
     APIBaseURL,
@@ -136,6 +137,9 @@ class ThordataClient:
         universalapi_base_url: str | None = None,
         web_scraper_api_base_url: str | None = None,
         locations_base_url: str | None = None,
+        cache_ttl: int = 10,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
     ) -> None:
         self.scraper_token = scraper_token
         self.public_token = public_token
@@ -146,6 +150,8 @@ class ThordataClient:
         self._default_timeout = timeout
         self._api_timeout = api_timeout
         self._retry_config = retry_config or RetryConfig()
+        # TTL (seconds) for read-only listings such as unlimited servers
+        self._cache_ttl = cache_ttl
 
         self._auth_mode = auth_mode.lower()
         if self._auth_mode not in (
@@ -156,9 +162,13 @@ class ThordataClient:
                 ErrorMessage.INVALID_AUTH_MODE.format(mode=auth_mode)
             )
 
-        # Initialize Core HTTP Client for API calls
+        # Initialize Core HTTP Client for API calls. The pool is sized so
+        # threads sharing one client reuse connections instead of blocking.
         self._http = ThordataHttpSession(
-            timeout=api_timeout, retry_config=self._retry_config
+            timeout=api_timeout,
+            retry_config=self._retry_config,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
         )
 
         # Legacy logic for Proxy Network connections (requests.Session)
@@ -183,6 +193,8 @@ class ThordataClient:
         self._download_url = urls["download_url"]
         self._list_url = urls["list_url"]
         self._locations_base_url = urls["locations_base_url"]
+        # Public API root (.../api -> shared by account and unlimited endpoints)
+        self._api_base = self._locations_base_url.replace("/locations", "")
         self._usage_stats_url = urls["usage_stats_url"]
         self._proxy_users_url = urls["proxy_users_url"]
         self._whitelist_url = urls["whitelist_url"]
@@ -191,14 +203,34 @@ class ThordataClient:
         self._gateway_base_url = urls["gateway_base_url"]
         self._child_base_url = urls["child_base_url"]
 
-        # Initialize Namespaces
-        self.serp = SerpNamespace(self)
-        self.unlimited = UnlimitedNamespace(self)
-        # New unified namespaces
-        self.universal = UniversalNamespace(self)
-        self.scraper = WebScraperNamespace(self)
-        self.account = AccountNamespace(self)
-        self.proxy = ProxyNamespace(self)
+    # =========================================================================
+    # Namespaces (built on first access)
+    # =========================================================================
+
+    @cached_property
+    def serp(self) -> SerpNamespace:
+        return SerpNamespace(self)
+
+    @cached_property
+    def unlimited(self) -> UnlimitedNamespace:
+        return UnlimitedNamespace(self)
+
+    # New unified namespaces
+    @cached_property
+    def universal(self) -> UniversalNamespace:
+        return UniversalNamespace(self)
+
+    @cached_property
+    def scraper(self) -> WebScraperNamespace:
+        return WebScraperNamespace(self)
+
+    @cached_property
+    def account(self) -> AccountNamespace:
+        return AccountNamespace(self)
+
+    @cached_property
+    def proxy(self) -> ProxyNamespace:
+        return ProxyNamespace(self)
 
     # =========================================================================
     # Context Manager
@@ -354,14 +386,17 @@ class ThordataClient:
         )
         return self.serp_search_advanced(request)
 
-    def serp_search_advanced(self, request: SerpRequest) -> dict[str, Any]:
+    def serp_search_advanced(
+        self, request: SerpRequest | SerpTypedRequest
+    ) -> dict[str, Any]:
         if not self.scraper_token:
             raise ThordataConfigError("scraper_token is required for SERP API")
 
         payload = request.to_payload()
         headers = build_auth_headers(self.scraper_token, mode=self._auth_mode)
 
-        logger.info(f"SERP Advanced Search: {request.engine} - {request.query[:50]}")
+        query = getattr(request, "query", None) or ""
+        logger.info(f"SERP Advanced Search: {request.engine} - {query[:50]}")
 
         response = self._api_request_with_retry(
             "POST",
@@ -372,7 +407,7 @@ class ThordataClient:
         response.raise_for_status()
 
         if request.output_format.lower() == "json":
-            data = response.json()
+            data = response_json(response)
             if isinstance(data, dict):
                 code = data.get("code")
                 if code is not None and code != 200:
@@ -395,7 +430,7 @@ class ThordataClient:
         This keeps the SDK minimal while offering better DX for engine/mode-specific
         required parameters with upfront validation.
         """
-        return self.serp_search_advanced(request.to_serp_request())
+        return self.serp_search_advanced(request)
 
     def serp_batch_search(
         self,
@@ -564,7 +599,7 @@ class ThordataClient:
             if response.status_code != 200:
                 # Try to extract error message from response
                 try:
-                    error_data = response.json()
+                    error_data = response_json(response)
                     msg = extract_error_message(error_data)
                     raise_for_code(
                         f"Universal Error: {msg}",
@@ -923,7 +958,7 @@ class ThordataClient:
             "POST", self._builder_url, data=payload, headers=headers
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Task creation failed",
@@ -967,7 +1002,7 @@ class ThordataClient:
             "POST", self._video_builder_url, data=payload, headers=headers
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Video task creation failed",
@@ -989,7 +1024,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Task status error",
@@ -1021,7 +1056,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
 
         if data.get("code") != 200:
             raise_for_code(
@@ -1051,7 +1086,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") == 200 and data.get("data"):
             return data["data"]["download"]
         raise_for_code(
@@ -1074,7 +1109,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "List tasks failed",
@@ -1198,7 +1233,7 @@ class ThordataClient:
             "GET", self._usage_stats_url, params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Usage stats error",
@@ -1212,18 +1247,17 @@ class ThordataClient:
     def get_traffic_balance(self) -> float:
         self._require_public_credentials()
         params = {"token": self.public_token, "key": self.public_key}
-        api_base = self._locations_base_url.replace("/locations", "")
         response = self._api_request_with_retry(
-            "GET", f"{api_base}/account/traffic-balance", params=params
+            "GET", f"{self._api_base}/account/traffic-balance", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Get traffic balance failed",
                 code=data.get("code"),
                 payload=data,
-                url=f"{self._locations_base_url.replace('/locations', '')}/account/traffic-balance",
+                url=f"{self._api_base}/account/traffic-balance",
                 method="GET",
             )
         return float(data.get("data", {}).get("traffic_balance", 0))
@@ -1231,12 +1265,11 @@ class ThordataClient:
     def get_wallet_balance(self) -> float:
         self._require_public_credentials()
         params = {"token": self.public_token, "key": self.public_key}
-        api_base = self._locations_base_url.replace("/locations", "")
         response = self._api_request_with_retry(
-            "GET", f"{api_base}/account/wallet-balance", params=params
+            "GET", f"{self._api_base}/account/wallet-balance", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Get wallet balance failed", code=data.get("code"), payload=data
@@ -1269,7 +1302,7 @@ class ThordataClient:
             "GET", f"{self._proxy_users_url}/usage-statistics", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Get user usage failed",
@@ -1311,7 +1344,7 @@ class ThordataClient:
             "GET", f"{self._proxy_users_url}/usage-statistics-hour", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Get hourly usage failed",
@@ -1374,7 +1407,7 @@ class ThordataClient:
         response.raise_for_status()
 
         if return_type == "json":
-            data = response.json()
+            data = response_json(response)
             if isinstance(data, dict):
                 if data.get("code") in (0, 200):
                     raw_list = data.get("data") or []
@@ -1388,7 +1421,7 @@ class ThordataClient:
             text = response.text.strip()
             if text.startswith("{") and "code" in text:
                 try:
-                    err_data = response.json()
+                    err_data = response_json(response)
                     raise_for_code(
                         "Extract IPs failed",
                         code=err_data.get("code"),
@@ -1417,7 +1450,7 @@ class ThordataClient:
             "GET", f"{self._proxy_users_url}/user-list", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code("List users error", code=data.get("code"), payload=data)
         return ProxyUserList.from_dict(data.get("data", data))
@@ -1447,7 +1480,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code("Create user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1492,7 +1525,7 @@ class ThordataClient:
             data=payload,
             headers=headers,
         )
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code("Update user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1513,7 +1546,7 @@ class ThordataClient:
             headers=headers,
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code("Delete user failed", code=data.get("code"), payload=data)
         return data.get("data", {})
@@ -1540,7 +1573,7 @@ class ThordataClient:
             "POST", f"{self._whitelist_url}/add-ip", data=payload, headers=headers
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Add whitelist IP failed", code=data.get("code"), payload=data
@@ -1560,7 +1593,7 @@ class ThordataClient:
             "POST", f"{self._whitelist_url}/delete-ip", data=payload, headers=headers
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "Delete whitelist IP failed", code=data.get("code"), payload=data
@@ -1582,7 +1615,7 @@ class ThordataClient:
             "GET", f"{self._whitelist_url}/ip-list", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "List whitelist IPs failed", code=data.get("code"), payload=data
@@ -1613,7 +1646,7 @@ class ThordataClient:
             "GET", f"{self._locations_base_url}/{endpoint}", params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
 
         if isinstance(data, dict):
             if data.get("code") != 200:
@@ -1670,7 +1703,7 @@ class ThordataClient:
             "GET", self._proxy_list_url, params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code(
                 "List proxy servers error", code=data.get("code"), payload=data
@@ -1699,7 +1732,7 @@ class ThordataClient:
             "GET", self._proxy_expiration_url, params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
         if data.get("code") != 200:
             raise_for_code("Get expiration error", code=data.get("code"), payload=data)
         return data.get("data", data)
@@ -1721,7 +1754,7 @@ class ThordataClient:
         # First, try to parse as JSON
         resp_json = None
         try:
-            resp_json = response.json()
+            resp_json = response_json(response)
         except ValueError:
             # If not JSON, check if it's a valid HTML/text response
             # This can happen when js_render=False and API returns raw HTML
@@ -1950,10 +1983,12 @@ class ThordataClient:
             req_headers = dict(headers or {})
         else:
             userpass = proxy_config.build_proxy_basic_auth()
-            proxy_headers = urllib3.make_headers(proxy_basic_auth=userpass)
+            proxy_headers = {
+                "proxy-authorization": proxy_config.basic_auth_header().decode("ascii")
+            }
             cache_key = self._proxy_manager_key(proxy_endpoint, userpass)
             pm = self._get_proxy_manager(
-                proxy_endpoint, cache_key=cache_key, proxy_headers=dict(proxy_headers)
+                proxy_endpoint, cache_key=cache_key, proxy_headers=proxy_headers
             )
             req_headers = dict(headers or {})
 
@@ -2043,10 +2078,8 @@ class ThordataClient:
                 # CONNECT to Thordata
                 connect_req = f"CONNECT {target_host}:{target_port} HTTP/1.1\r\n"
                 connect_req += f"Host: {target_host}:{target_port}\r\n"
-                auth = base64.b64encode(
-                    f"{thordata_user}:{thordata_pass}".encode()
-                ).decode()
-                connect_req += f"Proxy-Authorization: Basic {auth}\r\n\r\n"
+                auth = proxy_config.basic_auth_header().decode("ascii")
+                connect_req += f"Proxy-Authorization: {auth}\r\n\r\n"
                 sock.sendall(connect_req.encode())
 
                 resp = b""
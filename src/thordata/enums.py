@@ -11,6 +11,7 @@ from .types import (
     DataFormat,
     Device,
     Engine,
+    Engines,
     GoogleSearchType,
     GoogleTbm,
     OutputFormat,
@@ -29,6 +30,7 @@ __all__ = [
     "ProxyHost",
     "ProxyPort",
     "Engine",
+    "Engines",
     "GoogleSearchType",
     "BingSearchType",
     "GoogleTbm",
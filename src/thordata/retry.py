@@ -21,6 +21,7 @@ import logging
 import random
 import time
 from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Any, Callable
 
@@ -49,6 +50,10 @@ class RetryConfig:
         retry_on_status_codes: HTTP status codes to retry on.
         retry_on_exceptions: Exception types to retry on.
 
+    Other 4xx status codes fail fast without retrying. A ``Retry-After``
+    value from the server (rate-limit error or response header) is used
+    as a lower bound for the backoff delay, capped at ``max_backoff``.
+
     Example:
         >>> config = RetryConfig(
         ...     max_retries=5,
@@ -125,6 +130,10 @@ class RetryConfig:
         if status_code and status_code in self.retry_on_status_codes:
             return True
 
+        # Other 4xx responses (bad params, auth) won't succeed on retry
+        if isinstance(status_code, int) and 400 <= status_code < 500:
+            return False
+
         # Check exception type
         if isinstance(exception, self.retry_on_exceptions):
             return True
@@ -181,10 +190,9 @@ def with_retry(
                     if not config.should_retry(e, attempt, status_code):
                         raise
 
-                    delay = config.calculate_delay(attempt)
-
-                    if isinstance(e, ThordataRateLimitError) and e.retry_after:
-                        delay = max(delay, e.retry_after)
+                    delay = _respect_retry_after(
+                        config.calculate_delay(attempt), e, config.max_backoff
+                    )
 
                     logger.info(
                         f"Retry attempt {attempt + 1}/{config.max_retries} "
@@ -215,10 +223,9 @@ def with_retry(
                     if not config.should_retry(e, attempt, status_code):
                         raise
 
-                    delay = config.calculate_delay(attempt)
-
-                    if isinstance(e, ThordataRateLimitError) and e.retry_after:
-                        delay = max(delay, e.retry_after)
+                    delay = _respect_retry_after(
+                        config.calculate_delay(attempt), e, config.max_backoff
+                    )
 
                     logger.warning(
                         f"Async retry attempt {attempt + 1}/{config.max_retries} "
@@ -281,6 +288,47 @@ def _extract_status_code(exception: Exception) -> int | None:
     return None
 
 
+def _retry_after_seconds(exception: Exception) -> float | None:
+    """
+    Extract a server-requested wait time from an exception.
+
+    Uses ``ThordataRateLimitError.retry_after`` when set, otherwise the
+    ``Retry-After`` header (delta-seconds or HTTP-date) of the attached
+    requests/aiohttp response, unwrapping ``original_error`` as needed.
+    """
+    if isinstance(exception, ThordataRateLimitError) and exception.retry_after:
+        return float(exception.retry_after)
+
+    nested = getattr(exception, "original_error", None)
+    if isinstance(nested, Exception):
+        nested_wait = _retry_after_seconds(nested)
+        if nested_wait is not None:
+            return nested_wait
+
+    # requests.HTTPError carries .response; aiohttp.ClientResponseError .headers
+    response = getattr(exception, "response", None)
+    headers = getattr(response, "headers", None) or getattr(exception, "headers", None)
+    if not headers or not hasattr(headers, "get"):
+        return None
+    value = headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _respect_retry_after(delay: float, exception: Exception, cap: float) -> float:
+    """Use the server's ``Retry-After`` (at most ``cap``) as a floor for the delay."""
+    retry_after = _retry_after_seconds(exception)
+    return delay if retry_after is None else max(delay, min(retry_after, cap))
+
+
 class RetryableRequest:
     """
     Context manager for retryable requests with detailed control.
@@ -346,13 +394,10 @@ class RetryableRequest:
             The actual delay used.
         """
         delay = self.config.calculate_delay(self.attempt - 1)
-
-        # Handle rate limit retry_after
-        if (
-            isinstance(self.last_exception, ThordataRateLimitError)
-            and self.last_exception.retry_after
-        ):
-            delay = max(delay, self.last_exception.retry_after)
+        if self.last_exception is not None:
+            delay = _respect_retry_after(
+                delay, self.last_exception, self.config.max_backoff
+            )
 
         logger.debug(f"Waiting {delay:.2f}s before retry {self.attempt}")
         time.sleep(delay)
@@ -369,12 +414,10 @@ class RetryableRequest:
         import asyncio
 
         delay = self.config.calculate_delay(self.attempt - 1)
-
-        if (
-            isinstance(self.last_exception, ThordataRateLimitError)
-            and self.last_exception.retry_after
-        ):
-            delay = max(delay, self.last_exception.retry_after)
+        if self.last_exception is not None:
+            delay = _respect_retry_after(
+                delay, self.last_exception, self.config.max_backoff
+            )
 
         logger.debug(f"Async waiting {delay:.2f}s before retry {self.attempt}")
         await asyncio.sleep(delay)
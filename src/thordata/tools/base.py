@@ -4,6 +4,7 @@ Base classes for Web Scraper Tools.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import asdict, dataclass
 from typing import Any, ClassVar
 
@@ -16,6 +17,14 @@ class ToolRequest:
     SPIDER_ID: ClassVar[str]
     SPIDER_NAME: ClassVar[str]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Intern spider identifiers once so lookups keyed on them are cheap.
+        for attr in ("SPIDER_ID", "SPIDER_NAME"):
+            value = cls.__dict__.get(attr)
+            if isinstance(value, str):
+                setattr(cls, attr, sys.intern(value))
+
     def to_task_parameters(self) -> dict[str, Any]:
         """Convert dataclass fields to API parameters dict."""
         # Filter out internal fields and None values
@@ -9,6 +9,14 @@ from dataclasses import dataclass, field
 from ..types.common import CommonSettings
 from .base import ToolRequest, VideoToolRequest
 
+# Shared immutable default, so building many requests without custom
+# settings doesn't allocate a fresh CommonSettings for each one.
+_EMPTY_COMMON_SETTINGS = CommonSettings()
+
+
+def _default_settings() -> CommonSettings:
+    return _EMPTY_COMMON_SETTINGS
+
 
 class YouTube:
     """Namespace for YouTube tools."""
@@ -21,7 +29,7 @@ class YouTube:
         SPIDER_NAME = "youtube.com"
 
         url: str  # Video URL
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class AudioDownload(VideoToolRequest):
@@ -31,7 +39,7 @@ class YouTube:
         SPIDER_NAME = "youtube.com"
 
         url: str
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class SubtitleDownload(VideoToolRequest):
@@ -42,7 +50,7 @@ class YouTube:
 
         video_id: str
         subtitles_type: str | None = None  # Auto generated / user uploaded
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class Profile(VideoToolRequest):
@@ -53,7 +61,7 @@ class YouTube:
 
         keyword: str
         page_turning: int = 1
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class ProfileByUrl(VideoToolRequest):
@@ -63,7 +71,7 @@ class YouTube:
         SPIDER_NAME = "youtube.com"
 
         url: str  # Channel URL
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class Comments(VideoToolRequest):
@@ -75,7 +83,7 @@ class YouTube:
         video_id: str
         num_of_comments: int | None = None
         sort_by: str | None = None  # Top comments / Newest first
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class VideoInfo(VideoToolRequest):
@@ -85,7 +93,7 @@ class YouTube:
         SPIDER_NAME = "youtube.com"
 
         video_id: str
-        common_settings: CommonSettings = field(default_factory=CommonSettings)
+        common_settings: CommonSettings = field(default_factory=_default_settings)
 
     @dataclass
     class VideoPostByUrl(ToolRequest):
@@ -152,3 +160,6 @@ class YouTube:
 
         url: str
         all_tabs: str | None = None
+
+
+__all__ = ["YouTube"]
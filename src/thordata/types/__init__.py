@@ -34,6 +34,7 @@ from .serp import (
     BingVideosRequest,
     DuckDuckGoSearchRequest,
     Engine,
+    Engines,
     GoogleFinanceRequest,
     GoogleFlightsRequest,
     GoogleHotelsRequest,
@@ -65,6 +66,9 @@ from .task import (
     TaskStatusResponse,
     UsageStatistics,
     VideoTaskConfig,
+    is_failure_status,
+    is_success_status,
+    is_terminal_status,
 )
 from .universal import UniversalScrapeRequest
 
@@ -96,6 +100,7 @@ __all__ = [
     "BingVideosRequest",
     "DuckDuckGoSearchRequest",
     "Engine",
+    "Engines",
     "GoogleSearchType",
     "GoogleTbm",
     "SerpRequest",
@@ -125,5 +130,8 @@ __all__ = [
     "TaskStatusResponse",
     "UsageStatistics",
     "VideoTaskConfig",
+    "is_terminal_status",
+    "is_success_status",
+    "is_failure_status",
     "UniversalScrapeRequest",
 ]
@@ -7,8 +7,36 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup (pip install thordata-sdk[fast-json])
+    _orjson = None
+
+# Compact JSON for form-encoded payload values (no spaces after , and :).
+_JSON_SEPARATORS = (",", ":")
+
+
+def _dumps_compact(value: Any) -> str:
+    # orjson output is compact too, but leaves non-ASCII text unescaped.
+    # Values it can't encode (e.g. non-str keys) fall back to the stdlib.
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, separators=_JSON_SEPARATORS)
+
+
+def _lower(value: str) -> str:
+    # str.lower() always allocates; most values already arrive lowercase.
+    # str subclasses (e.g. str Enums) still go through lower() to get a plain str.
+    if type(value) is str and value.islower():
+        return value
+    return value.lower()
+
 
 class ThordataBaseConfig:
     """Base class for all config objects with payload conversion."""
@@ -28,11 +56,13 @@ class OutputFormat(str, Enum):
     PNG = "png"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CommonSettings:
     """
     Common settings for video/audio downloads.
     Keys strictly aligned with Thordata Video Builder API.
+
+    Instances are immutable so a single default can be shared safely.
     """
 
     resolution: str | None = None
@@ -55,17 +85,27 @@ class CommonSettings:
         return result
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return _settings_json(self)
+
+
+# Settings are immutable and usually shared (e.g. the empty default), so
+# their JSON is encoded once per distinct value.
+@lru_cache(maxsize=128)
+def _settings_json(settings: CommonSettings) -> str:
+    return _dumps_compact(settings.to_dict())
 
 
 def normalize_enum_value(value: object, enum_class: type) -> str:
     """
     Safely convert an enum or string to its string value.
     """
+    if type(value) is str:
+        return _lower(value)
+    raw = getattr(value, "value", value)
+    if isinstance(raw, str):
+        return raw.lower()
     if isinstance(value, enum_class):
-        return str(getattr(value, "value", value)).lower()
-    if isinstance(value, str):
-        return value.lower()
+        return str(raw).lower()
     raise TypeError(
         f"Expected {enum_class.__name__} or str, got {type(value).__name__}"
     )
@@ -4,7 +4,9 @@ Proxy related types and configurations.
 
 from __future__ import annotations
 
-import re
+import base64
+import string
+import time
 import uuid
 from dataclasses import dataclass
 from enum import Enum, IntEnum
@@ -14,6 +16,23 @@ from urllib.parse import quote
 # Import geography from common to avoid circular issues
 from .common import Continent
 
+# Traffic unit conversions (powers of two, so multiplication is exact).
+_KB_TO_GB = 1.0 / (1024 * 1024)
+_MB_TO_GB = 1.0 / 1024
+
+
+def _encode_basic_auth(userpass: str) -> bytes:
+    return b"Basic " + base64.b64encode(userpass.encode("utf-8"))
+
+
+# Characters quote() never escapes; credentials made only of these are
+# returned as-is without going through quote().
+_URL_SAFE = frozenset(string.ascii_letters + string.digits + "-._~")
+
+
+def _fast_quote(value: str) -> str:
+    return value if _URL_SAFE.issuperset(value) else quote(value, safe="")
+
 
 class ProxyProduct(str, Enum):
     RESIDENTIAL = "residential"
@@ -115,7 +134,10 @@ class ProxyConfig:
         if self.continent and self.continent.lower() not in self._VALID_CONTINENTS:
             raise ValueError(f"Invalid continent code: {self.continent}")
 
-        if self.country and not re.match(r"^[a-zA-Z]{2}$", self.country):
+        country = self.country
+        if country and not (
+            len(country) == 2 and country.isascii() and country.isalpha()
+        ):
             raise ValueError("Invalid country code")
 
     def build_username(self) -> str:
@@ -125,6 +147,8 @@ class ProxyConfig:
 
         parts = [base]
 
+        # Normalized here rather than at construction, so fields assigned
+        # after __post_init__ are formatted the same way.
         if self.continent:
             parts.append(f"continent-{self.continent.lower()}")
         if self.country:
@@ -134,12 +158,8 @@ class ProxyConfig:
         if self.city:
             parts.append(f"city-{self.city.lower()}")
         if self.asn:
-            asn_val = (
-                self.asn.upper()
-                if self.asn.upper().startswith("AS")
-                else f"AS{self.asn.upper()}"
-            )
-            parts.append(f"asn-{asn_val}")
+            asn = self.asn.upper()
+            parts.append(f"asn-{asn}" if asn.startswith("AS") else f"asn-AS{asn}")
         if self.session_id:
             parts.append(f"sessid-{self.session_id}")
         if self.session_duration:
@@ -151,8 +171,8 @@ class ProxyConfig:
         user = self.build_username()
         proto = "socks5h" if self.protocol == "socks5" else self.protocol
 
-        safe_user = quote(user, safe="")
-        safe_pass = quote(self.password, safe="")
+        safe_user = _fast_quote(user)
+        safe_pass = _fast_quote(self.password)
 
         return f"{proto}://{safe_user}:{safe_pass}@{self.host}:{self.port}"
 
@@ -171,6 +191,10 @@ class ProxyConfig:
     def build_proxy_basic_auth(self) -> str:
         return f"{self.build_username()}:{self.password}"
 
+    def basic_auth_header(self) -> bytes:
+        """``Proxy-Authorization`` value (``b"Basic <b64>"``) for the current fields."""
+        return _encode_basic_auth(self.build_proxy_basic_auth())
+
     def to_proxies_dict(self) -> dict[str, str]:
         url = self.build_proxy_url()
         return {"http": url, "https": url}
@@ -214,10 +238,14 @@ class StaticISPProxy:
         # FIX: Added this method to satisfy client.py interface
         return f"{self.username}:{self.password}"
 
+    def basic_auth_header(self) -> bytes:
+        """``Proxy-Authorization`` value (``b"Basic <b64>"``) for the current fields."""
+        return _encode_basic_auth(self.build_proxy_basic_auth())
+
     def build_proxy_url(self) -> str:
         proto = "socks5h" if self.protocol == "socks5" else self.protocol
-        safe_user = quote(self.username, safe="")
-        safe_pass = quote(self.password, safe="")
+        safe_user = _fast_quote(self.username)
+        safe_pass = _fast_quote(self.password)
         return f"{proto}://{safe_user}:{safe_pass}@{self.host}:{self.port}"
 
     def to_proxies_dict(self) -> dict[str, str]:
@@ -262,7 +290,7 @@ class StickySession(ProxyConfig):
         super().__post_init__()
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProxyUser:
     username: str
     password: str
@@ -272,21 +300,23 @@ class ProxyUser:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ProxyUser:
+        get = data.get
+        status = get("status")
         return cls(
-            username=str(data.get("username", "")),
-            password=str(data.get("password", "")),
-            status=str(data.get("status")).lower() in ("true", "1"),
-            traffic_limit=int(data.get("traffic_limit", 0)),
-            usage_traffic=float(data.get("usage_traffic", 0)),
+            username=str(get("username", "")),
+            password=str(get("password", "")),
+            status=status is True or str(status).lower() in ("true", "1"),
+            traffic_limit=int(get("traffic_limit", 0)),
+            usage_traffic=float(get("usage_traffic", 0)),
         )
 
     def usage_gb(self) -> float:
-        return self.usage_traffic / (1024 * 1024)
+        """Used traffic in GB (``usage_traffic`` is reported in KB)."""
+        return self.usage_traffic * _KB_TO_GB
 
     def limit_gb(self) -> float:
-        if self.traffic_limit == 0:
-            return 0.0
-        return self.traffic_limit / 1024.0
+        """Traffic limit in GB (``traffic_limit`` is reported in MB)."""
+        return self.traffic_limit * _MB_TO_GB
 
 
 @dataclass
@@ -305,7 +335,7 @@ class ProxyUserList:
         if not isinstance(user_list_raw, list):
             user_list_raw = []
 
-        users = [ProxyUser.from_dict(u) for u in user_list_raw]
+        users = list(map(ProxyUser.from_dict, user_list_raw))
 
         return cls(
             limit=float(data.get("limit", 0)),
@@ -315,7 +345,7 @@ class ProxyUserList:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProxyServer:
     ip: str
     port: int
@@ -338,11 +368,16 @@ class ProxyServer:
     def to_proxy_url(self, protocol: str = "https") -> str:
         return f"{protocol}://{self.username}:{self.password}@{self.ip}:{self.port}"
 
-    def is_expired(self) -> bool:
-        if self.expiration_time is None:
-            return False
-        import time
+    def is_expired(self, now: float | None = None) -> bool:
+        """
+        Check whether the server has expired.
 
-        if isinstance(self.expiration_time, int):
-            return time.time() > self.expiration_time
-        return False
+        Args:
+            now: Current epoch time in seconds. Pass a single ``time.time()``
+                value when checking many servers in one sweep.
+        """
+        if not isinstance(self.expiration_time, int):
+            return False
+        if now is None:
+            now = time.time()
+        return now > self.expiration_time
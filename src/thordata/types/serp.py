@@ -4,11 +4,15 @@ SERP (Search Engine Results Page) related types and configurations.
 
 from __future__ import annotations
 
+import sys
+import warnings
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Final, NamedTuple
 
-from .common import ThordataBaseConfig
+from .common import ThordataBaseConfig, _lower
 
 
 class Engine(str, Enum):
@@ -60,6 +64,102 @@ class Engine(str, Enum):
     )
 
 
+class Engines:
+    """
+    Engine names as plain interned ``str`` constants.
+
+    Mirrors :class:`Engine` for code that compares or hashes engine names
+    directly and doesn't need Enum members.
+    """
+
+    # Google
+    GOOGLE: Final[str] = sys.intern("google")
+    GOOGLE_AI_MODE: Final[str] = sys.intern("google_ai_mode")
+    GOOGLE_NEWS: Final[str] = sys.intern("google_news")
+    GOOGLE_SHOPPING: Final[str] = sys.intern("google_shopping")
+    GOOGLE_VIDEOS: Final[str] = sys.intern("google_videos")
+    GOOGLE_IMAGES: Final[str] = sys.intern("google_images")
+    GOOGLE_MAPS: Final[str] = sys.intern("google_maps")
+    GOOGLE_JOBS: Final[str] = sys.intern("google_jobs")
+    GOOGLE_PLAY: Final[str] = sys.intern("google_play")
+    GOOGLE_PLAY_PRODUCT: Final[str] = sys.intern("google_play_product")
+    GOOGLE_PLAY_GAMES: Final[str] = sys.intern("google_play_games")
+    GOOGLE_PLAY_MOVIES: Final[str] = sys.intern("google_play_movies")
+    GOOGLE_PLAY_BOOKS: Final[str] = sys.intern("google_play_books")
+    GOOGLE_TRENDS: Final[str] = sys.intern("google_trends")
+    GOOGLE_SCHOLAR: Final[str] = sys.intern("google_scholar")
+    GOOGLE_SCHOLAR_CITE: Final[str] = sys.intern("google_scholar_cite")
+    GOOGLE_SCHOLAR_AUTHOR: Final[str] = sys.intern("google_scholar_author")
+    GOOGLE_PATENTS: Final[str] = sys.intern("google_patents")
+    GOOGLE_PATENTS_DETAILS: Final[str] = sys.intern("google_patents_details")
+    GOOGLE_FINANCE: Final[str] = sys.intern("google_finance")
+    GOOGLE_FINANCE_MARKETS: Final[str] = sys.intern("google_finance_markets")
+    GOOGLE_FLIGHTS: Final[str] = sys.intern("google_flights")
+    GOOGLE_LENS: Final[str] = sys.intern("google_lens")
+    GOOGLE_HOTELS: Final[str] = sys.intern("google_hotels")
+
+    # Bing
+    BING: Final[str] = sys.intern("bing")
+    BING_NEWS: Final[str] = sys.intern("bing_news")
+    BING_SHOPPING: Final[str] = sys.intern("bing_shopping")
+    BING_IMAGES: Final[str] = sys.intern("bing_images")
+    BING_VIDEOS: Final[str] = sys.intern("bing_videos")
+    BING_MAPS: Final[str] = sys.intern("bing_maps")
+
+    # Others
+    YANDEX: Final[str] = sys.intern("yandex")
+    DUCKDUCKGO: Final[str] = sys.intern("duckduckgo")
+    BAIDU: Final[str] = sys.intern("baidu")
+
+    # Legacy / Compatibility Aliases
+    GOOGLE_SEARCH: Final[str] = sys.intern("google_search")
+    GOOGLE_WEB: Final[str] = sys.intern("google_web")
+    GOOGLE_LOCAL: Final[str] = sys.intern("google_local")
+    GOOGLE_PRODUCT: Final[str] = sys.intern("google_product")
+
+    ALL: Final[frozenset[str]] = frozenset(
+        {
+            GOOGLE,
+            GOOGLE_AI_MODE,
+            GOOGLE_NEWS,
+            GOOGLE_SHOPPING,
+            GOOGLE_VIDEOS,
+            GOOGLE_IMAGES,
+            GOOGLE_MAPS,
+            GOOGLE_JOBS,
+            GOOGLE_PLAY,
+            GOOGLE_PLAY_PRODUCT,
+            GOOGLE_PLAY_GAMES,
+            GOOGLE_PLAY_MOVIES,
+            GOOGLE_PLAY_BOOKS,
+            GOOGLE_TRENDS,
+            GOOGLE_SCHOLAR,
+            GOOGLE_SCHOLAR_CITE,
+            GOOGLE_SCHOLAR_AUTHOR,
+            GOOGLE_PATENTS,
+            GOOGLE_PATENTS_DETAILS,
+            GOOGLE_FINANCE,
+            GOOGLE_FINANCE_MARKETS,
+            GOOGLE_FLIGHTS,
+            GOOGLE_LENS,
+            GOOGLE_HOTELS,
+            BING,
+            BING_NEWS,
+            BING_SHOPPING,
+            BING_IMAGES,
+            BING_VIDEOS,
+            BING_MAPS,
+            YANDEX,
+            DUCKDUCKGO,
+            BAIDU,
+            GOOGLE_SEARCH,
+            GOOGLE_WEB,
+            GOOGLE_LOCAL,
+            GOOGLE_PRODUCT,
+        }
+    )
+
+
 class GoogleSearchType(str, Enum):
     SEARCH = "search"
     NEWS = "news"
@@ -94,8 +194,253 @@ class TimeRange(str, Enum):
     YEAR = "year"
 
 
+# --- Parameter mappings ---
+
+_SEARCH_TYPE_MAP: dict[str, str] = {
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "images": "isch",
+        "shopping": "shop",
+        "news": "nws",
+        "videos": "vid",
+        "isch": "isch",
+        "shop": "shop",
+        "nws": "nws",
+        "vid": "vid",
+    }.items()
+}
+
+_TIME_FILTER_MAP: dict[str, str] = {
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "hour": "qdr:h",
+        "day": "qdr:d",
+        "week": "qdr:w",
+        "month": "qdr:m",
+        "year": "qdr:y",
+    }.items()
+}
+
+# output_format -> 'json' payload value
+_FMT_MAP: dict[str, str] = {
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "json": "1",
+        "html": "3",
+        "light_json": "4",
+        "light-json": "4",
+        "lightjson": "4",
+        "2": "2",
+        "both": "2",
+        "json+html": "2",
+    }.items()
+}
+# Formats mapping to json=2, which Dashboard does not support
+_FMT_WARN = frozenset(k for k, v in _FMT_MAP.items() if v == "2")
+
+# Bool -> API string tables, indexed by bool(value).
+_BOOL_TRUE_FALSE = ("False", "True")
+_BOOL_ONE_ZERO = ("0", "1")
+_BOOL_ACTIVE_OFF = ("off", "active")
+
+# (attribute, payload key) pairs sent verbatim when set.
+_STR_FIELDS: tuple[tuple[str, str], ...] = (
+    ("google_domain", "google_domain"),
+    ("countries_filter", "cr"),
+    ("languages_filter", "lr"),
+    ("location", "location"),
+    ("uule", "uule"),
+    ("ludocid", "ludocid"),
+    ("kgmid", "kgmid"),
+)
+
+# (attribute, payload key, lookup table) for Google-only fields; the
+# lowercased value is mapped, or sent as-is when not in the table.
+_GOOGLE_MAPPED_FIELDS: tuple[tuple[str, str, dict[str, str]], ...] = (
+    ("search_type", "tbm", _SEARCH_TYPE_MAP),
+    ("time_filter", "tbs", _TIME_FILTER_MAP),
+)
+
+# (attribute, payload key, (false, true) strings) for optional flags sent
+# whenever they are not None.
+_GOOGLE_FLAG_FIELDS: tuple[tuple[str, str, tuple[str, str]], ...] = (
+    ("safe_search", "safe", _BOOL_ACTIVE_OFF),
+    ("filter_duplicates", "filter", _BOOL_ONE_ZERO),
+)
+_FLAG_FIELDS: tuple[tuple[str, str, tuple[str, str]], ...] = (
+    ("render_js", "render_js", _BOOL_TRUE_FALSE),
+    ("no_cache", "no_cache", _BOOL_TRUE_FALSE),
+)
+
+
+# --- Engine descriptors ---
+
+
+def _paginate_google(
+    req: SerpRequest | SerpTypedRequest, payload: dict[str, Any]
+) -> None:
+    # Google (+ other engines that behave similarly)
+    payload["num"] = str(req.num)
+    if req.start > 0:
+        payload["start"] = str(req.start)
+    if req.country:
+        payload["gl"] = _lower(req.country)
+    if req.language:
+        payload["hl"] = _lower(req.language)
+
+
+def _paginate_bing(
+    req: SerpRequest | SerpTypedRequest, payload: dict[str, Any]
+) -> None:
+    # Bing uses 1-based 'first' and 'count'
+    if req.start > 0:
+        payload["first"] = str(req.start + 1)
+    payload["count"] = str(req.num)
+    if req.country:
+        payload["cc"] = _lower(req.country)
+    if req.language:
+        payload["mkt"] = req.language
+
+
+def _paginate_yandex(
+    req: SerpRequest | SerpTypedRequest, payload: dict[str, Any]
+) -> None:
+    # Yandex supports 'lang' (UI language) but also has its own 'lr' region param.
+    if req.language:
+        payload["lang"] = req.language
+    # Yandex pagination is 'p' (page index); keep 'start/num' out unless user passes via extra_params.
+
+
+def _paginate_duckduckgo(
+    req: SerpRequest | SerpTypedRequest, payload: dict[str, Any]
+) -> None:
+    # DuckDuckGo supports 'start' but has no standard 'num' param in our docs.
+    if req.start > 0:
+        payload["start"] = str(req.start)
+    if req.language:
+        # Best-effort: DuckDuckGo uses 'kl' for region/lang (e.g. 'us-en').
+        payload["kl"] = req.language
+
+
+class _EngineSpec(NamedTuple):
+    """How an engine's payload is shaped (query key, paging, Google-only params)."""
+
+    is_google: bool
+    query_key: str
+    paginate: Callable[[SerpRequest | SerpTypedRequest, dict[str, Any]], None]
+
+
+_GOOGLE_ENGINES = frozenset(e for e in Engines.ALL if e.startswith("google"))
+_BING_ENGINES = frozenset(e for e in Engines.ALL if e.startswith("bing"))
+
+_GOOGLE_SPEC = _EngineSpec(True, "q", _paginate_google)
+_BING_SPEC = _EngineSpec(False, "q", _paginate_bing)
+_DEFAULT_SPEC = _EngineSpec(False, "q", _paginate_google)
+
+# Known engines resolve with one lookup.
+_ENGINE_TABLE: dict[str, _EngineSpec] = {
+    **dict.fromkeys(_GOOGLE_ENGINES, _GOOGLE_SPEC),
+    **dict.fromkeys(_BING_ENGINES, _BING_SPEC),
+    Engines.YANDEX: _EngineSpec(False, "text", _paginate_yandex),
+    Engines.DUCKDUCKGO: _EngineSpec(False, "q", _paginate_duckduckgo),
+}
+
+
+def _engine_spec(engine: str) -> _EngineSpec:
+    spec = _ENGINE_TABLE.get(engine)
+    if spec is not None:
+        return spec
+    # Engine strings outside the Engine enum keep the family prefix rules.
+    if engine.startswith("google"):
+        return _GOOGLE_SPEC
+    if engine.startswith("bing"):
+        return _BING_SPEC
+    return _DEFAULT_SPEC
+
+
+def _normalize_engine(raw_engine: Any) -> str:
+    # Allow both string and Enum values for engine (for backwards compatibility).
+    if isinstance(raw_engine, Enum):
+        raw_engine = raw_engine.value
+    return sys.intern(str(raw_engine).lower())
+
+
+def _build_payload(
+    req: SerpRequest | SerpTypedRequest, query: str, *, stacklevel: int
+) -> dict[str, Any]:
+    """Build the SERP payload (without extras) from a request's common fields."""
+    engine = _normalize_engine(req.engine)
+    spec = _engine_spec(engine)
+    is_google = spec.is_google
+
+    # JSON output handling
+    # Dashboard mapping: json=1 (json), json=3 (html), json=4 (light json)
+    # Note: json=2 (both) format is not supported by Dashboard
+    fmt = _lower(req.output_format)
+    json_code = _FMT_MAP.get(fmt)
+    if json_code and fmt in _FMT_WARN:
+        warnings.warn(
+            "The 'both' output format (json=2) is not supported by Dashboard. "
+            "Use 'json' or 'html' instead.",
+            DeprecationWarning,
+            stacklevel=stacklevel,
+        )
+
+    # Keys present on every request go in as one literal; the rest are
+    # optional and added below. If no json param is set, the API defaults
+    # to HTML (legacy behavior).
+    payload: dict[str, Any]
+    if json_code:
+        payload = {"engine": engine, "json": json_code, spec.query_key: query}
+    else:
+        payload = {"engine": engine, spec.query_key: query}
+
+    # Pagination + localization differ per engine family
+    spec.paginate(req, payload)
+
+    # Pass-through string fields
+    for attr, key in _STR_FIELDS:
+        value = getattr(req, attr)
+        if value:
+            payload[key] = value
+
+    # Google-only search type / filters
+    if is_google:
+        for attr, key, table in _GOOGLE_MAPPED_FIELDS:
+            value = getattr(req, attr)
+            if value:
+                value = _lower(value)
+                payload[key] = table.get(value, value)
+        for attr, key, strings in _GOOGLE_FLAG_FIELDS:
+            value = getattr(req, attr)
+            if value is not None:
+                payload[key] = strings[bool(value)]
+        if req.no_autocorrect:
+            payload["nfpr"] = "1"
+
+    # Device & Rendering
+    if req.device:
+        payload["device"] = _lower(req.device)
+    for attr, key, strings in _FLAG_FIELDS:
+        value = getattr(req, attr)
+        if value is not None:
+            payload[key] = strings[bool(value)]
+
+    # AI Overview (only for Google engine)
+    if req.ai_overview:
+        if engine != "google":
+            raise ValueError(
+                "ai_overview parameter is only supported for engine=google"
+            )
+        payload["ai_overview"] = "true"
+
+    return payload
+
+
 @dataclass
 class SerpRequest(ThordataBaseConfig):
+    """Generic SERP request."""
+
     query: str
     engine: str = "google"
     num: int = 10
@@ -138,152 +483,22 @@ class SerpRequest(ThordataBaseConfig):
     # Pass-through for any other param
     extra_params: dict[str, Any] = field(default_factory=dict)
 
-    # Mappings
-    SEARCH_TYPE_MAP = {
-        "images": "isch",
-        "shopping": "shop",
-        "news": "nws",
-        "videos": "vid",
-        "isch": "isch",
-        "shop": "shop",
-        "nws": "nws",
-        "vid": "vid",
-    }
-
-    TIME_FILTER_MAP = {
-        "hour": "qdr:h",
-        "day": "qdr:d",
-        "week": "qdr:w",
-        "month": "qdr:m",
-        "year": "qdr:y",
-    }
+    # Mappings (read-only views of the module-level tables)
+    SEARCH_TYPE_MAP: ClassVar[Mapping[str, str]] = MappingProxyType(_SEARCH_TYPE_MAP)
+    TIME_FILTER_MAP: ClassVar[Mapping[str, str]] = MappingProxyType(_TIME_FILTER_MAP)
 
     def to_payload(self) -> dict[str, Any]:
-        # Allow both string and Enum values for engine (for backwards compatibility).
-        raw_engine = self.engine
-        if isinstance(raw_engine, Enum):
-            engine_str = str(raw_engine.value)
-        else:
-            engine_str = str(raw_engine)
-        engine = engine_str.lower()
-
-        payload: dict[str, Any] = {"engine": engine}
-
-        # JSON output handling
-        # Dashboard mapping: json=1 (json), json=3 (html), json=4 (light json)
-        # Note: json=2 (both) format is not supported by Dashboard
-        fmt = self.output_format.lower()
-        if fmt == "json":
-            payload["json"] = "1"
-        elif fmt == "html":
-            payload["json"] = "3"
-        elif fmt in ("light_json", "light-json", "lightjson"):
-            payload["json"] = "4"
-        elif fmt in ("2", "both", "json+html"):
-            import warnings
-
-            warnings.warn(
-                "The 'both' output format (json=2) is not supported by Dashboard. "
-                "Use 'json' or 'html' instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
-            payload["json"] = "2"
-        # If no json param is set, default to HTML (legacy behavior)
-
-        # Query param handling
-        if engine == "yandex":
-            payload["text"] = self.query
-        else:
-            payload["q"] = self.query
-
-        # Basic fields
-        if self.google_domain:
-            payload["google_domain"] = self.google_domain
-        # Pagination + localization differ per engine family
-        if engine.startswith("bing"):
-            # Bing uses 1-based 'first' and 'count'
-            if self.start > 0:
-                payload["first"] = str(self.start + 1)
-            payload["count"] = str(self.num)
-            if self.country:
-                payload["cc"] = self.country.lower()
-            if self.language:
-                payload["mkt"] = self.language
-        elif engine == "yandex":
-            # Yandex supports 'lang' (UI language) but also has its own 'lr' region param.
-            if self.language:
-                payload["lang"] = self.language
-            # Yandex pagination is 'p' (page index); keep 'start/num' out unless user passes via extra_params.
-        elif engine == "duckduckgo":
-            # DuckDuckGo supports 'start' but has no standard 'num' param in our docs.
-            if self.start > 0:
-                payload["start"] = str(self.start)
-            if self.language:
-                # Best-effort: DuckDuckGo uses 'kl' for region/lang (e.g. 'us-en').
-                payload["kl"] = self.language
-        else:
-            # Google (+ other engines that behave similarly)
-            payload["num"] = str(self.num)
-            if self.start > 0:
-                payload["start"] = str(self.start)
-            if self.country:
-                payload["gl"] = self.country.lower()
-            if self.language:
-                payload["hl"] = self.language.lower()
-        if self.countries_filter:
-            payload["cr"] = self.countries_filter
-        if self.languages_filter:
-            payload["lr"] = self.languages_filter
-        if self.location:
-            payload["location"] = self.location
-        if self.uule:
-            payload["uule"] = self.uule
-
-        # Search Type (tbm)
-        if self.search_type and engine.startswith("google"):
-            val = self.search_type.lower()
-            payload["tbm"] = self.SEARCH_TYPE_MAP.get(val, val)
-
-        # Filters
-        if self.safe_search is not None and engine.startswith("google"):
-            payload["safe"] = "active" if self.safe_search else "off"
-
-        if self.time_filter and engine.startswith("google"):
-            val = self.time_filter.lower()
-            payload["tbs"] = self.TIME_FILTER_MAP.get(val, val)
-
-        if self.no_autocorrect and engine.startswith("google"):
-            payload["nfpr"] = "1"
-        if self.filter_duplicates is not None and engine.startswith("google"):
-            payload["filter"] = "1" if self.filter_duplicates else "0"
-
-        # Device & Rendering
-        if self.device:
-            payload["device"] = self.device.lower()
-        if self.render_js is not None:
-            payload["render_js"] = "True" if self.render_js else "False"
-        if self.no_cache is not None:
-            payload["no_cache"] = "True" if self.no_cache else "False"
-
-        # Advanced
-        if self.ludocid:
-            payload["ludocid"] = self.ludocid
-        if self.kgmid:
-            payload["kgmid"] = self.kgmid
-
-        # AI Overview (only for Google engine)
-        if self.ai_overview:
-            if engine != "google":
-                raise ValueError(
-                    "ai_overview parameter is only supported for engine=google"
-                )
-            payload["ai_overview"] = "true"
-
-        # Merge extras
-        payload.update(self.extra_params)
+        # Built per call: fields may be changed after construction.
+        payload = _build_payload(self, self.query, stacklevel=3)
+        if self.extra_params:
+            payload.update(self.extra_params)
         return payload
 
+    @staticmethod
+    def build_payloads(requests: Iterable[SerpRequest]) -> list[dict[str, Any]]:
+        """Build payloads for a batch of requests, in order."""
+        return [req.to_payload() for req in requests]
+
 
 # =============================================================================
 # Strongly-Typed SERP Requests (minimal & extensible)
@@ -304,6 +519,7 @@ class SerpTypedRequest(ThordataBaseConfig):
     - engine (fixed string)
     - required fields for that engine/mode
     - optional fields as needed
+    - `_serp_query()` / `_mode_params()` when they send a query or mode params
     """
 
     # Common options
@@ -335,13 +551,29 @@ class SerpTypedRequest(ThordataBaseConfig):
     # Subclass must override
     engine: str = "google"
 
+    # Fields that must be non-blank, checked in __post_init__
+    _REQUIRED: ClassVar[tuple[str, ...]] = ()
+
+    def __post_init__(self) -> None:
+        self._validate_common()
+        self._require(self._REQUIRED)
+
     def _validate_common(self) -> None:
         if self.num < 1:
             raise ValueError("num must be >= 1")
         if self.start < 0:
             raise ValueError("start must be >= 0")
 
-    def _build_serp_request(self, *, query: str) -> SerpRequest:
+    def _require(self, names: tuple[str, ...]) -> None:
+        for name in names:
+            value = getattr(self, name)
+            text = value if isinstance(value, str) else str(value)
+            if not text or text.isspace():
+                raise ValueError(f"{type(self).__name__}.{name} is required")
+
+    def _build_serp_request(
+        self, *, query: str, extra_params: dict[str, Any] | None = None
+    ) -> SerpRequest:
         self._validate_common()
         return SerpRequest(
             query=query,
@@ -367,16 +599,37 @@ class SerpTypedRequest(ThordataBaseConfig):
             ai_overview=self.ai_overview,
             ludocid=self.ludocid,
             kgmid=self.kgmid,
-            extra_params=dict(self.extra_params),
+            extra_params=(
+                dict(self.extra_params) if extra_params is None else extra_params
+            ),
         )
 
+    def _serp_query(self) -> str:
+        """Value sent as the search query (``q`` / ``text``)."""
+        return ""
+
+    def _mode_params(self) -> dict[str, Any]:
+        """Engine/mode specific params layered over ``extra_params``."""
+        return {}
+
     def to_serp_request(self) -> SerpRequest:
-        """
-        Convert this typed request into a `SerpRequest`.
+        """Convert this typed request into a `SerpRequest`."""
+        # Always a fresh dict, so neither request sees the other's mutations.
+        return self._build_serp_request(
+            query=self._serp_query(),
+            extra_params={**self.extra_params, **self._mode_params()},
+        )
 
-        Subclasses must implement this and should call `_build_serp_request()`.
-        """
-        raise NotImplementedError("Subclasses must implement to_serp_request()")
+    def to_payload(self) -> dict[str, Any]:
+        """Build the API payload directly, without an intermediate `SerpRequest`."""
+        payload = _build_payload(self, self._serp_query(), stacklevel=3)
+        if self.extra_params:
+            payload.update(self.extra_params)
+        # Mode params are usually empty; skip the merge then.
+        mode_params = self._mode_params()
+        if mode_params:
+            payload.update(mode_params)
+        return payload
 
 
 # --- Google ---
@@ -387,13 +640,10 @@ class GoogleSearchRequest(SerpTypedRequest):
     engine: str = "google"
     query: str = ""
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not self.query.strip():
-            raise ValueError("GoogleSearchRequest.query is required")
+    _REQUIRED = ("query",)
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        return super()._build_serp_request(query=self.query)
+    def _serp_query(self) -> str:
+        return self.query
 
 
 @dataclass
@@ -461,11 +711,8 @@ class GoogleMapsRequest(GoogleSearchRequest):
     engine: str = "google_maps"
     ll: str | None = None  # GPS coordinates string like '@lat,lon,14z'
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super().to_serp_request()
-        if self.ll:
-            req.extra_params["ll"] = self.ll
-        return req
+    def _mode_params(self) -> dict[str, Any]:
+        return {"ll": self.ll} if self.ll else {}
 
 
 @dataclass
@@ -473,15 +720,10 @@ class GoogleProductRequest(SerpTypedRequest):
     engine: str = "google_product"
     product_id: str = ""
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not str(self.product_id).strip():
-            raise ValueError("GoogleProductRequest.product_id is required")
+    _REQUIRED = ("product_id",)
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super()._build_serp_request(query="")
-        req.extra_params["product_id"] = str(self.product_id).strip()
-        return req
+    def _mode_params(self) -> dict[str, Any]:
+        return {"product_id": str(self.product_id).strip()}
 
 
 @dataclass
@@ -492,23 +734,17 @@ class GoogleFlightsRequest(SerpTypedRequest):
     outbound_date: str = ""  # YYYY-MM-DD
     return_date: str | None = None
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not self.departure_id.strip():
-            raise ValueError("GoogleFlightsRequest.departure_id is required")
-        if not self.arrival_id.strip():
-            raise ValueError("GoogleFlightsRequest.arrival_id is required")
-        if not self.outbound_date.strip():
-            raise ValueError("GoogleFlightsRequest.outbound_date is required")
-
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super()._build_serp_request(query="")
-        req.extra_params["departure_id"] = self.departure_id
-        req.extra_params["arrival_id"] = self.arrival_id
-        req.extra_params["outbound_date"] = self.outbound_date
+    _REQUIRED = ("departure_id", "arrival_id", "outbound_date")
+
+    def _mode_params(self) -> dict[str, Any]:
+        params = {
+            "departure_id": self.departure_id,
+            "arrival_id": self.arrival_id,
+            "outbound_date": self.outbound_date,
+        }
         if self.return_date:
-            req.extra_params["return_date"] = self.return_date
-        return req
+            params["return_date"] = self.return_date
+        return params
 
 
 @dataclass
@@ -518,24 +754,23 @@ class GoogleLensRequest(SerpTypedRequest):
     query: str | None = None  # Optional q for lens
     type: str | None = None  # Optional lens type
 
+    _REQUIRED = ("url",)
+
     def __post_init__(self) -> None:
-        self._validate_common()
+        super().__post_init__()
         u = self.url.strip()
-        if not u:
-            raise ValueError("GoogleLensRequest.url is required")
-        if not (u.startswith("http://") or u.startswith("https://")):
+        if not u.startswith(("http://", "https://")):
             raise ValueError(
                 "GoogleLensRequest.url must start with http:// or https://"
             )
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super()._build_serp_request(query="")
-        req.extra_params["url"] = self.url.strip()
+    def _mode_params(self) -> dict[str, Any]:
+        params = {"url": self.url.strip()}
         if self.query:
-            req.extra_params["q"] = self.query
+            params["q"] = self.query
         if self.type:
-            req.extra_params["type"] = self.type
-        return req
+            params["type"] = self.type
+        return params
 
 
 # --- Bing ---
@@ -546,13 +781,10 @@ class BingSearchRequest(SerpTypedRequest):
     engine: str = "bing"
     query: str = ""
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not self.query.strip():
-            raise ValueError("BingSearchRequest.query is required")
+    _REQUIRED = ("query",)
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        return super()._build_serp_request(query=self.query)
+    def _serp_query(self) -> str:
+        return self.query
 
 
 @dataclass
@@ -580,11 +812,8 @@ class BingMapsRequest(BingSearchRequest):
     engine: str = "bing_maps"
     cp: str | None = None  # Optional GPS coordinates string like 'lat~lon'
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super().to_serp_request()
-        if self.cp:
-            req.extra_params["cp"] = self.cp
-        return req
+    def _mode_params(self) -> dict[str, Any]:
+        return {"cp": self.cp} if self.cp else {}
 
 
 # --- Others ---
@@ -596,16 +825,13 @@ class DuckDuckGoSearchRequest(SerpTypedRequest):
     query: str = ""
     kl: str | None = None  # region/lang
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not self.query.strip():
-            raise ValueError("DuckDuckGoSearchRequest.query is required")
+    _REQUIRED = ("query",)
+
+    def _serp_query(self) -> str:
+        return self.query
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        req = super()._build_serp_request(query=self.query)
-        if self.kl:
-            req.extra_params["kl"] = self.kl
-        return req
+    def _mode_params(self) -> dict[str, Any]:
+        return {"kl": self.kl} if self.kl else {}
 
 
 @dataclass
@@ -613,10 +839,7 @@ class YandexSearchRequest(SerpTypedRequest):
     engine: str = "yandex"
     query: str = ""
 
-    def __post_init__(self) -> None:
-        self._validate_common()
-        if not self.query.strip():
-            raise ValueError("YandexSearchRequest.query is required")
+    _REQUIRED = ("query",)
 
-    def to_serp_request(self) -> SerpRequest:  # type: ignore[override]
-        return super()._build_serp_request(query=self.query)
+    def _serp_query(self) -> str:
+        return self.query
@@ -4,13 +4,12 @@ Web Scraper Task types.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 from urllib.parse import unquote
 
-from .common import CommonSettings, ThordataBaseConfig
+from .common import CommonSettings, ThordataBaseConfig, _dumps_compact
 
 
 class TaskStatus(str, Enum):
@@ -26,22 +25,40 @@ class TaskStatus(str, Enum):
 
     @classmethod
     def is_terminal(cls, status: TaskStatus) -> bool:
-        return status in {
-            cls.READY,
-            cls.SUCCESS,
-            cls.FINISHED,
-            cls.FAILED,
-            cls.ERROR,
-            cls.CANCELLED,
-        }
+        return status in _TERMINAL_STATUSES
 
     @classmethod
     def is_success(cls, status: TaskStatus) -> bool:
-        return status in {cls.READY, cls.SUCCESS, cls.FINISHED}
+        return status in _SUCCESS_STATUSES
 
     @classmethod
     def is_failure(cls, status: TaskStatus) -> bool:
-        return status in {cls.FAILED, cls.ERROR}
+        return status in _FAILURE_STATUSES
+
+
+_SUCCESS_STATUSES = frozenset(
+    {TaskStatus.READY, TaskStatus.SUCCESS, TaskStatus.FINISHED}
+)
+_FAILURE_STATUSES = frozenset({TaskStatus.FAILED, TaskStatus.ERROR})
+_TERMINAL_STATUSES = _SUCCESS_STATUSES | _FAILURE_STATUSES | {TaskStatus.CANCELLED}
+
+
+# Plain-function forms of the TaskStatus checks, for status polling loops.
+def is_terminal_status(status: TaskStatus) -> bool:
+    return status in _TERMINAL_STATUSES
+
+
+def is_success_status(status: TaskStatus) -> bool:
+    return status in _SUCCESS_STATUSES
+
+
+def is_failure_status(status: TaskStatus) -> bool:
+    return status in _FAILURE_STATUSES
+
+
+# Raw (lowercase) status strings, for responses that carry plain str status.
+_SUCCESS_STATUS_VALUES = frozenset(s.value for s in _SUCCESS_STATUSES)
+_TERMINAL_STATUS_VALUES = frozenset(s.value for s in _TERMINAL_STATUSES)
 
 
 class DataFormat(str, Enum):
@@ -71,10 +88,10 @@ def _normalize_url_value(value: Any) -> Any:
     return value
 
 
-def _normalize_parameters(params: dict[str, Any]) -> dict[str, Any]:
-    # All parameter keys that contain URLs and should be normalized
-    # This ensures API/SDK submissions match Dashboard format exactly
-    url_keys = {
+# All parameter keys that contain URLs and should be normalized
+# This ensures API/SDK submissions match Dashboard format exactly
+_URL_KEYS = frozenset(
+    {
         "url",
         "domain",
         "profileurl",
@@ -87,13 +104,16 @@ def _normalize_parameters(params: dict[str, Any]) -> dict[str, Any]:
         "product_url",
         "category_url",
     }
-    out: dict[str, Any] = {}
-    for k, v in params.items():
-        if k in url_keys:
-            out[k] = _normalize_url_value(v)
-        else:
-            out[k] = v
-    return out
+)
+
+
+def _normalize_parameters(params: dict[str, Any]) -> dict[str, Any]:
+    # Most parameter dicts carry no URL keys; they are serialized as-is.
+    if _URL_KEYS.isdisjoint(params):
+        return params
+    return {
+        k: _normalize_url_value(v) if k in _URL_KEYS else v for k, v in params.items()
+    }
 
 
 @dataclass
@@ -111,11 +131,13 @@ class ScraperTaskConfig(ThordataBaseConfig):
     def to_payload(self) -> dict[str, Any]:
         # Normalize parameters: decode percent-encoded URLs to reduce API/Dashboard divergence
         if isinstance(self.parameters, list):
-            normalized_list = [_normalize_parameters(p) for p in self.parameters]
-            params_json = json.dumps(normalized_list)
+            normalized_list = list(map(_normalize_parameters, self.parameters))
+            params_json = _dumps_compact(normalized_list)
         else:
+            # A single dict is sent as a one-element list; wrap the encoded
+            # object rather than building a throwaway list to encode.
             normalized_one = _normalize_parameters(self.parameters)
-            params_json = json.dumps([normalized_one])
+            params_json = "[" + _dumps_compact(normalized_one) + "]"
 
         payload: dict[str, Any] = {
             "file_name": self.file_name,
@@ -125,7 +147,7 @@ class ScraperTaskConfig(ThordataBaseConfig):
             "spider_errors": "true" if self.include_errors else "false",
         }
         if self.universal_params:
-            payload["spider_universal"] = json.dumps(self.universal_params)
+            payload["spider_universal"] = _dumps_compact(self.universal_params)
         # Add data_format if specified (for json/csv/xlsx output)
         if self.data_format:
             fmt = (
@@ -148,9 +170,9 @@ class VideoTaskConfig(ThordataBaseConfig):
 
     def to_payload(self) -> dict[str, Any]:
         if isinstance(self.parameters, list):
-            params_json = json.dumps(self.parameters)
+            params_json = _dumps_compact(self.parameters)
         else:
-            params_json = json.dumps([self.parameters])
+            params_json = "[" + _dumps_compact(self.parameters) + "]"
 
         payload: dict[str, Any] = {
             "file_name": self.file_name,
@@ -171,18 +193,10 @@ class TaskStatusResponse:
     message: str | None = None
 
     def is_complete(self) -> bool:
-        terminal_statuses = {
-            "ready",
-            "success",
-            "finished",
-            "failed",
-            "error",
-            "cancelled",
-        }
-        return self.status.lower() in terminal_statuses
+        return self.status.lower() in _TERMINAL_STATUS_VALUES
 
     def is_success(self) -> bool:
-        return self.status.lower() in {"ready", "success", "finished"}
+        return self.status.lower() in _SUCCESS_STATUS_VALUES
 
 
 @dataclass
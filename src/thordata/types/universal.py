@@ -8,7 +8,19 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
-from .common import ThordataBaseConfig
+from .common import ThordataBaseConfig, _lower
+
+# Bool -> API string, indexed by bool(value).
+_BOOL_TRUE_FALSE = ("False", "True")
+
+_VALID_FORMATS = frozenset({"html", "png"})
+# Plain single-format strings skip the split/validate path.
+_SINGLE_FORMATS: dict[str, tuple[str, ...]] = {
+    "html": ("html",),
+    "png": ("png",),
+    "HTML": ("html",),
+    "PNG": ("png",),
+}
 
 
 @dataclass
@@ -33,25 +45,28 @@ class UniversalScrapeRequest(ThordataBaseConfig):
     extra_params: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        # Normalize output_format to list for easier handling
-        if isinstance(self.output_format, str):
-            formats = [f.strip().lower() for f in self.output_format.split(",")]
-        else:
-            formats = [
-                f.lower() if isinstance(f, str) else str(f).lower()
-                for f in self.output_format
-            ]
-
-        valid_formats = {"html", "png"}
-        invalid = [f for f in formats if f not in valid_formats]
-        if invalid:
-            raise ValueError(
-                f"Invalid output_format: {invalid}. Must be one or more of: {valid_formats}. "
-                f"Use comma-separated string like 'png,html' or list ['png', 'html'] for multiple formats."
-            )
-
-        # Store as list for to_payload
+        # Normalize output_format to a tuple for easier handling
+        fmt = self.output_format
+        formats = _SINGLE_FORMATS.get(fmt) if isinstance(fmt, str) else None
+        if formats is None:
+            if isinstance(fmt, str):
+                parts = [f.strip().lower() for f in fmt.split(",")]
+            else:
+                parts = [
+                    f.lower() if isinstance(f, str) else str(f).lower() for f in fmt
+                ]
+
+            invalid = [f for f in parts if f not in _VALID_FORMATS]
+            if invalid:
+                raise ValueError(
+                    f"Invalid output_format: {invalid}. Must be one or more of: {set(_VALID_FORMATS)}. "
+                    f"Use comma-separated string like 'png,html' or list ['png', 'html'] for multiple formats."
+                )
+            formats = tuple(parts)
+
+        # Store for to_payload
         self._output_formats = formats
+        self._output_type = ",".join(formats)
 
         if self.wait is not None and (self.wait < 0 or self.wait > 100000):
             raise ValueError("wait must be between 0 and 100000 milliseconds")
@@ -67,27 +82,18 @@ class UniversalScrapeRequest(ThordataBaseConfig):
         """
         payload: dict[str, Any] = {
             "url": self.url,
+            # Always include js_render parameter (API expects string "True" or "False")
+            # This ensures consistent behavior whether js_render is True or False
+            "js_render": _BOOL_TRUE_FALSE[bool(self.js_render)],
+            # Output format maps to the 'type' parameter
+            "type": self._output_type,
         }
 
-        # Always include js_render parameter (API expects string "True" or "False")
-        # This ensures consistent behavior whether js_render is True or False
-        payload["js_render"] = "True" if self.js_render else "False"
-
-        # Handle output format (maps to 'type' parameter)
-        if hasattr(self, "_output_formats") and self._output_formats:
-            payload["type"] = ",".join(self._output_formats)
-        else:
-            # Fallback for backward compatibility
-            if isinstance(self.output_format, str):
-                payload["type"] = self.output_format.lower()
-            else:
-                payload["type"] = ",".join([str(f).lower() for f in self.output_format])
-
         # Optional parameters (only include if set)
         if self.header is not None:
-            payload["header"] = "True" if self.header else "False"
+            payload["header"] = _BOOL_TRUE_FALSE[bool(self.header)]
         if self.country:
-            payload["country"] = self.country.lower()
+            payload["country"] = _lower(self.country)
         if self.block_resources:
             payload["block_resources"] = self.block_resources
         if self.clean_content:
@@ -97,7 +103,7 @@ class UniversalScrapeRequest(ThordataBaseConfig):
         if self.wait_for:
             payload["wait_for"] = self.wait_for
         if self.follow_redirect is not None:
-            payload["follow_redirect"] = "True" if self.follow_redirect else "False"
+            payload["follow_redirect"] = _BOOL_TRUE_FALSE[bool(self.follow_redirect)]
 
         # Serialize complex objects as JSON strings
         if self.headers:
@@ -106,5 +112,6 @@ class UniversalScrapeRequest(ThordataBaseConfig):
             payload["cookies"] = json.dumps(self.cookies)
 
         # Merge any extra parameters (allows future API extensions)
-        payload.update(self.extra_params)
+        if self.extra_params:
+            payload.update(self.extra_params)
         return payload
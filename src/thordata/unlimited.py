@@ -4,14 +4,44 @@ Sync interface for Unlimited Residential Proxy management.
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from ._utils import build_public_api_headers
+from ._performance import SimpleCache, SingleFlight
+from ._utils import build_public_api_headers, response_json
 from .exceptions import raise_for_code
 
 if TYPE_CHECKING:
     from .client import ThordataClient
 
+# GET endpoints, joined to the API root once per namespace like the POST ones.
+_SERVER_LIST = "/unlimited/server-list"
+_SERVER_MONITOR = "/unlimited/server-monitor"
+_BALANCING_MONITOR = "/unlimited/balancing-monitor"
+_GET_ENDPOINTS = (_SERVER_LIST, _SERVER_MONITOR, _BALANCING_MONITOR)
+# POST action endpoints
+_POST_ENDPOINTS = (
+    "/unlimited/restart-server",
+    "/unlimited/renew",
+    "/unlimited/upgrade",
+    "/get_unlimited_servers_bind_user",
+    "/add_unlimited_servers_bind_user",
+    "/del_unlimited_servers_bind_user",
+)
+# The one POST endpoint that only reads (and so doesn't invalidate the cache)
+_LIST_BOUND_USERS = "/get_unlimited_servers_bind_user"
+
+
+def _endpoint_urls(api_base: str) -> Mapping[str, str]:
+    """Read-only map of endpoint path -> full URL under ``api_base``."""
+    return MappingProxyType(
+        {ep: api_base + ep for ep in _GET_ENDPOINTS + _POST_ENDPOINTS}
+    )
+
 
 class UnlimitedNamespace:
     """
@@ -20,34 +50,55 @@ class UnlimitedNamespace:
 
     def __init__(self, client: ThordataClient):
         self._client = client
-        # Base URL for unlimited endpoints (usually same as public API base)
-        # We can reuse _locations_base_url logic to find the API root
-        # locations_base: .../api/locations -> root: .../api
-        self._api_base = client._locations_base_url.replace("/locations", "")
+        # Base URL for unlimited endpoints (the public API root, .../api)
+        self._api_base = client._api_base
+        self._urls = _endpoint_urls(self._api_base)
+        # (credentials, headers) pair, replaced as a whole when creds change
+        self._headers_cache: tuple[tuple[str, str], dict[str, str]] | None = None
+        # Short-lived cache for read-only listings; cleared by any POST action
+        self._cache = SimpleCache(ttl=client._cache_ttl)
+        # Concurrent cache misses share one in-flight listing request
+        self._inflight = SingleFlight()
 
-    def list_servers(self) -> list[dict[str, Any]]:
+    def list_servers(self, *, force_refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get the list of unlimited proxy servers.
 
+        Args:
+            force_refresh: Skip the client's short-lived listing cache.
+
         Returns:
             List of server objects.
         """
         self._client._require_public_credentials()
+        key = self._cache_key("servers")
+        cached = None if force_refresh else self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        # Concurrent callers share one fetch; each gets its own copy.
+        return copy.deepcopy(self._inflight.do(key, partial(self._fetch_servers, key)))
+
+    def _fetch_servers(self, key: str) -> list[dict[str, Any]]:
+        # Read first: a clear() during the request means the result may be stale
+        generation = self._cache.generation
         params = {
             "token": self._client.public_token,
             "key": self._client.public_key,
         }
         response = self._client._api_request_with_retry(
-            "GET", f"{self._api_base}/unlimited/server-list", params=params
+            "GET", self._urls[_SERVER_LIST], params=params
         )
         response.raise_for_status()
-        data = response.json()
-        if data.get("code") != 200:
-            raise_for_code("List servers failed", code=data.get("code"), payload=data)
+        data = response_json(response)
+        code = data.get("code")
+        if code != 200:
+            raise_for_code("List servers failed", code=code, payload=data)
 
         # API returns { "data": [...] } OR { "data": { "list": [...] } } sometimes
         # Assuming standard list return
-        return data.get("data") or []
+        servers = data.get("data") or []
+        self._cache.set(key, copy.deepcopy(servers), generation=generation)
+        return servers
 
     def restart_server(self, plan_name: str) -> dict[str, Any]:
         """Restart an unlimited proxy server."""
@@ -66,11 +117,39 @@ class UnlimitedNamespace:
             {"plan_name": plan_name, "target_plan": target_plan},
         )
 
-    def list_bound_users(self, ip: str) -> list[dict[str, Any]]:
+    def list_bound_users(
+        self, ip: str, *, force_refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """List users bound to a specific unlimited server IP."""
-        data = self._post_action("/get_unlimited_servers_bind_user", {"ip": ip})
+        key = self._cache_key(f"bound:{ip}")
+        cached = None if force_refresh else self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        generation = self._cache.generation
+        data = self._post_action(_LIST_BOUND_USERS, {"ip": ip})
         # Assuming data structure similar to other lists
-        return data.get("list") or [] if isinstance(data, dict) else []
+        users = data.get("list") or [] if isinstance(data, dict) else []
+        # The cache keeps its own copy, so callers may mutate what they get.
+        self._cache.set(key, copy.deepcopy(users), generation=generation)
+        return users
+
+    def list_bound_users_batch(
+        self, ips: list[str], *, concurrency: int = 10
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        List bound users for many server IPs concurrently.
+
+        Args:
+            ips: Server IPs to query.
+            concurrency: Maximum number of concurrent requests (1-20).
+
+        Returns:
+            Mapping of IP -> bound users, in input order. The first failing
+            lookup raises.
+        """
+        concurrency = min(max(concurrency, 1), 20)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return dict(zip(ips, executor.map(self.list_bound_users, ips)))
 
     def bind_user(self, ip: str, username: str) -> dict[str, Any]:
         """Bind a sub-user to an unlimited server IP."""
@@ -84,21 +163,82 @@ class UnlimitedNamespace:
             "/del_unlimited_servers_bind_user", {"ip": ip, "username": username}
         )
 
+    def bind_users_batch(
+        self, pairs: list[tuple[str, str]], *, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """
+        Bind many sub-users concurrently.
+
+        Args:
+            pairs: (ip, username) pairs to bind.
+            concurrency: Maximum number of concurrent requests (1-20).
+
+        Returns:
+            One result per pair, in input order, each containing 'index', 'ok',
+            'ip', 'username', and 'output' or 'error'.
+        """
+        return self._users_batch("/add_unlimited_servers_bind_user", pairs, concurrency)
+
+    def unbind_users_batch(
+        self, pairs: list[tuple[str, str]], *, concurrency: int = 10
+    ) -> list[dict[str, Any]]:
+        """Unbind many sub-users concurrently. See `bind_users_batch`."""
+        return self._users_batch("/del_unlimited_servers_bind_user", pairs, concurrency)
+
+    def _users_batch(
+        self, endpoint: str, pairs: list[tuple[str, str]], concurrency: int
+    ) -> list[dict[str, Any]]:
+        concurrency = min(max(concurrency, 1), 20)
+
+        def _one(i: int, pair: tuple[str, str]) -> dict[str, Any]:
+            ip, username = pair
+            result: dict[str, Any] = {"index": i, "ip": ip, "username": username}
+            try:
+                output = self._post_action(endpoint, {"ip": ip, "username": username})
+                result.update(ok=True, output=output)
+            except Exception as e:
+                result.update(
+                    ok=False,
+                    error={"type": type(e).__name__, "message": str(e)},
+                )
+            return result
+
+        # Threads share the client's pooled session, so connections are reused
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(_one, range(len(pairs)), pairs))
+
+    def _cache_key(self, name: str) -> str:
+        # Listings belong to one account, so entries are scoped to the
+        # client's current public credentials.
+        client = self._client
+        return f"{name}:{client.public_token or ''}:{client.public_key or ''}"
+
+    def _public_headers(self) -> dict[str, str]:
+        # Rebuilt only when the client's public credentials change.
+        creds = (self._client.public_token or "", self._client.public_key or "")
+        cached = self._headers_cache
+        if cached is None or cached[0] != creds:
+            # Swapped in with one assignment, so batch worker threads never
+            # see new credentials paired with old or empty headers.
+            cached = (creds, build_public_api_headers(*creds))
+            self._headers_cache = cached
+        return cached[1]
+
     def _post_action(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
         """Helper for POST actions."""
         self._client._require_public_credentials()
-        headers = build_public_api_headers(
-            self._client.public_token or "", self._client.public_key or ""
-        )
+        headers = self._public_headers()
         response = self._client._api_request_with_retry(
-            "POST", f"{self._api_base}{endpoint}", data=payload, headers=headers
+            "POST", self._urls[endpoint], data=payload, headers=headers
         )
         response.raise_for_status()
-        data = response.json()
-        if data.get("code") != 200:
-            raise_for_code(
-                f"Action {endpoint} failed", code=data.get("code"), payload=data
-            )
+        data = response_json(response)
+        code = data.get("code")
+        if code != 200:
+            raise_for_code(f"Action {endpoint} failed", code=code, payload=data)
+        if endpoint != _LIST_BOUND_USERS:
+            # Servers/bindings may have changed; drop cached listings.
+            self._cache.clear()
         return data.get("data", {})
 
     def get_server_monitor(
@@ -124,14 +264,13 @@ class UnlimitedNamespace:
         }
         # Note: Endpoint is /api/unlimited/server-monitor
         response = self._client._api_request_with_retry(
-            "GET", f"{self._api_base}/unlimited/server-monitor", params=params
+            "GET", self._urls[_SERVER_MONITOR], params=params
         )
         response.raise_for_status()
-        data = response.json()
-        if data.get("code") != 200:
-            raise_for_code(
-                "Get server monitor failed", code=data.get("code"), payload=data
-            )
+        data = response_json(response)
+        code = data.get("code")
+        if code != 200:
+            raise_for_code("Get server monitor failed", code=code, payload=data)
         return data.get("data", {})
 
     def get_balancing_monitor(
@@ -156,10 +295,10 @@ class UnlimitedNamespace:
             "period": str(period),
         }
         response = self._client._api_request_with_retry(
-            "GET", f"{self._api_base}/unlimited/balancing-monitor", params=params
+            "GET", self._urls[_BALANCING_MONITOR], params=params
         )
         response.raise_for_status()
-        data = response.json()
+        data = response_json(response)
 
         # Note: This endpoint uses 'status_code' instead of 'code' in the root
         code = data.get("status_code", data.get("code"))
@@ -0,0 +1,101 @@
+"""
+Plain stand-ins for HTTP responses and requests, shared by the unit tests.
+
+Import these directly (``from ._stubs import StubResponse``); fixtures built
+on them live in ``conftest.py``.
+"""
+
+import json
+from collections.abc import Generator
+from typing import Any
+
+
+class StubResponse:
+    """Minimal requests.Response stand-in (plain attributes, no MagicMock)."""
+
+    __slots__ = ("status_code", "text", "content", "_json")
+
+    def __init__(
+        self,
+        json_data: Any,
+        status_code: int = 200,
+        text: str = "<html></html>",
+        content: bytes = b"<html></html>",
+    ) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.content = content
+        self._json = json_data
+
+    def json(self) -> Any:
+        if isinstance(self._json, Exception):
+            raise self._json
+        return self._json
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class DummyAsyncResponse:
+    """
+    Minimal async fake response object for aiohttp.
+    Made awaitable to support 'await session.request(...)'.
+    """
+
+    def __init__(self, json_data: dict[str, Any], status: int = 200) -> None:
+        self._json_data = json_data
+        self.status = status
+        self._text: str | None = None
+
+    # Support 'await response' pattern used by session.request in new core
+    def __await__(self) -> Generator[Any, None, "DummyAsyncResponse"]:
+        yield
+        return self
+
+    async def __aenter__(self) -> "DummyAsyncResponse":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def json(self, **kwargs: Any) -> dict[str, Any]:
+        return self._json_data
+
+    async def read(self) -> bytes:
+        return (await self.text()).encode("utf-8")
+
+    async def text(self) -> str:
+        # Serialized on first use only; most tests never read the body
+        if self._text is None:
+            self._text = json.dumps(self._json_data)
+        return self._text
+
+
+class FakeRequest:
+    """Async stand-in for ``client._http.request`` returning a fixed response."""
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+        self.calls = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        return self.response
+
+
+class ApiStub:
+    """Stand-in for ``_api_request_with_retry`` that records calls.
+
+    Tests set ``response`` to the object every call should return.
+    """
+
+    def __init__(self) -> None:
+        self.response: Any = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.response
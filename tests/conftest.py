@@ -6,12 +6,15 @@ Integration tests are gated by THORDATA_INTEGRATION=true and require real creden
 see CONTRIBUTING.md and .env.example (Testing section).
 """
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
 from thordata import ThordataClient
 
+from ._stubs import ApiStub, FakeRequest, StubResponse
+
 
 @pytest.fixture
 def mock_credentials():
@@ -25,24 +28,57 @@ def mock_credentials():
 
 @pytest.fixture
 def mock_response():
-    """Create a mock requests.Response object."""
-    response = MagicMock()
-    response.status_code = 200
-    response.raise_for_status = MagicMock()
-    response.json.return_value = {"code": 200, "data": {}}
-    response.text = "<html></html>"
-    response.content = b"<html></html>"
-    return response
+    """Create a stub requests.Response object."""
+    return StubResponse({"code": 200, "data": {}})
 
 
 @pytest.fixture
 def mock_session(mock_response):
-    """Create a mock requests.Session object."""
-    session = MagicMock()
-    session.get.return_value = mock_response
-    session.post.return_value = mock_response
-    session.request.return_value = mock_response
-    return session
+    """Create a stub requests.Session object."""
+
+    def respond(*args: Any, **kwargs: Any) -> StubResponse:
+        return mock_response
+
+    return SimpleNamespace(get=respond, post=respond, request=respond)
+
+
+@pytest.fixture
+def install_fake_request(monkeypatch):
+    """Return a helper that stubs an async client's HTTP request for one test."""
+
+    def install(client: Any, response: Any) -> FakeRequest:
+        fake = FakeRequest(response)
+        monkeypatch.setattr(client._http, "request", fake)
+        return fake
+
+    return install
+
+
+@pytest.fixture
+def api_stub(monkeypatch, client):
+    """Route the test's ``client`` API requests to an ApiStub for one test."""
+    stub = ApiStub()
+    monkeypatch.setattr(client, "_api_request_with_retry", stub)
+    return stub
+
+
+@pytest.fixture(scope="session")
+def full_client():
+    """ThordataClient with every credential, built once for the whole session.
+
+    Tests may only stub it via patch.object/monkeypatch, which revert per test.
+    """
+    client = ThordataClient(scraper_token="st", public_token="pt", public_key="pk")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def scraper_only_client():
+    """Session-wide ThordataClient with only a scraper token (see full_client)."""
+    client = ThordataClient(scraper_token="st")
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -2,9 +2,10 @@
 Tests for AsyncThordataClient.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
 
 from thordata import AsyncThordataClient
 from thordata.exceptions import ThordataConfigError, ThordataNetworkError
@@ -18,17 +19,16 @@ from thordata.types import (
     VideoTaskConfig,
 )
 
-# Mark all tests in this module as async
-pytestmark = pytest.mark.asyncio
+from ._stubs import DummyAsyncResponse
+
+# Mark all tests in this module as async; they share one module-wide event
+# loop so the module-scoped client fixture below can be reused across tests.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 def _async_response_with_json(json_data):
-    """Build a mock aiohttp response that returns json_data from await .json()."""
-    resp = MagicMock()
-    resp.json = AsyncMock(return_value=json_data)
-    resp.raise_for_status = MagicMock()
-    resp.status = 200
-    return resp
+    """Build a stub aiohttp response that returns json_data from await .json()."""
+    return DummyAsyncResponse(json_data)
 
 
 # Mock Credentials
@@ -48,9 +48,9 @@ def _https_proxy_config_dummy() -> ProxyConfig:
     )
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def async_client():
-    """Fixture for AsyncThordataClient with context management."""
+    """AsyncThordataClient with an open session, shared across this module."""
     client = AsyncThordataClient(
         scraper_token=TEST_SCRAPER,
         public_token=TEST_PUB_TOKEN,
@@ -141,38 +141,42 @@ async def test_async_invalid_auth_mode_raises():
         AsyncThordataClient(scraper_token="t", auth_mode="invalid")
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def async_client_coverage():
-    """Client with session for coverage tests; closed after test."""
+    """Client with session shared by the coverage tests; closed after the module.
+
+    Tests only patch ``client._http.request``, so the underlying aiohttp
+    session is never hit and can be created once instead of per test.
+    """
     client = AsyncThordataClient(scraper_token="st", public_token="pt", public_key="pk")
     await client._http._ensure_session()
     yield client
     await client.close()
 
 
-async def test_async_serp_search_advanced_success(async_client_coverage):
+async def test_async_serp_search_advanced_success(
+    async_client_coverage, install_fake_request
+):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": {"organic": []}})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        req = SerpRequest(query="test", engine="google")
-        out = await client.serp_search_advanced(req)
+    install_fake_request(client, mock_resp)
+    req = SerpRequest(query="test", engine="google")
+    out = await client.serp_search_advanced(req)
     assert "data" in out and "organic" in out["data"]
 
 
-async def test_async_universal_scrape_advanced_success(async_client_coverage):
+async def test_async_universal_scrape_advanced_success(
+    async_client_coverage, install_fake_request
+):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "html": "<body>ok</body>"})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        req = UniversalScrapeRequest(url="https://example.com", output_format="html")
-        out = await client.universal_scrape_advanced(req)
+    install_fake_request(client, mock_resp)
+    req = UniversalScrapeRequest(url="https://example.com", output_format="html")
+    out = await client.universal_scrape_advanced(req)
     assert out == "<body>ok</body>"
 
 
-async def test_async_get_task_status(async_client_coverage):
+async def test_async_get_task_status(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -180,26 +184,23 @@ async def test_async_get_task_status(async_client_coverage):
             "data": [{"task_id": "tid1", "status": "ready"}],
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        status = await client.get_task_status("tid1")
+    install_fake_request(client, mock_resp)
+    status = await client.get_task_status("tid1")
     assert status == "ready"
 
 
 async def test_async_safe_get_task_status_returns_error_on_failure(
     async_client_coverage,
+    install_fake_request,
 ):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 401, "msg": "Unauthorized"})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        status = await client.safe_get_task_status("tid1")
+    install_fake_request(client, mock_resp)
+    status = await client.safe_get_task_status("tid1")
     assert status == "error"
 
 
-async def test_async_get_task_result(async_client_coverage):
+async def test_async_get_task_result(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -207,14 +208,12 @@ async def test_async_get_task_result(async_client_coverage):
             "data": {"download": "https://cdn.example/out.json"},
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        url = await client.get_task_result("tid1", file_type="json")
+    install_fake_request(client, mock_resp)
+    url = await client.get_task_result("tid1", file_type="json")
     assert url == "https://cdn.example/out.json"
 
 
-async def test_async_list_tasks(async_client_coverage):
+async def test_async_list_tasks(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -222,10 +221,8 @@ async def test_async_list_tasks(async_client_coverage):
             "data": {"count": 2, "list": [{"task_id": "t1"}, {"task_id": "t2"}]},
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_tasks(page=1, size=10)
+    install_fake_request(client, mock_resp)
+    out = await client.list_tasks(page=1, size=10)
     assert out["count"] == 2 and len(out["list"]) == 2
 
 
@@ -238,7 +235,7 @@ async def test_async_wait_for_task_returns_on_ready(async_client_coverage):
     assert status == "ready"
 
 
-async def test_async_get_usage_statistics(async_client_coverage):
+async def test_async_get_usage_statistics(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -252,32 +249,26 @@ async def test_async_get_usage_statistics(async_client_coverage):
             },
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        stats = await client.get_usage_statistics("2024-01-01", "2024-01-07")
+    install_fake_request(client, mock_resp)
+    stats = await client.get_usage_statistics("2024-01-01", "2024-01-07")
     assert stats.total_usage_traffic == 1000 and stats.traffic_balance == 2000
 
 
-async def test_async_get_traffic_balance(async_client_coverage):
+async def test_async_get_traffic_balance(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {"code": 200, "data": {"traffic_balance": 123.45}}
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        bal = await client.get_traffic_balance()
+    install_fake_request(client, mock_resp)
+    bal = await client.get_traffic_balance()
     assert bal == 123.45
 
 
-async def test_async_get_wallet_balance(async_client_coverage):
+async def test_async_get_wallet_balance(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": {"balance": 99.99}})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        bal = await client.get_wallet_balance()
+    install_fake_request(client, mock_resp)
+    bal = await client.get_wallet_balance()
     assert bal == 99.99
 
 
@@ -371,7 +362,7 @@ async def test_async_universal_scrape_batch(async_client_coverage, monkeypatch):
     assert results[1]["ok"] and results[1]["output"].startswith("HTML for")
 
 
-async def test_async_list_proxy_users(async_client_coverage):
+async def test_async_list_proxy_users(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -392,34 +383,28 @@ async def test_async_list_proxy_users(async_client_coverage):
             },
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_proxy_users()
+    install_fake_request(client, mock_resp)
+    out = await client.list_proxy_users()
     assert out.user_count == 1 and len(out.users) == 1
 
 
-async def test_async_add_whitelist_ip(async_client_coverage):
+async def test_async_add_whitelist_ip(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": {"ip": "1.2.3.4"}})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.add_whitelist_ip("1.2.3.4", proxy_type=ProxyType.RESIDENTIAL)
+    install_fake_request(client, mock_resp)
+    out = await client.add_whitelist_ip("1.2.3.4", proxy_type=ProxyType.RESIDENTIAL)
     assert out["ip"] == "1.2.3.4"
 
 
-async def test_async_list_whitelist_ips(async_client_coverage):
+async def test_async_list_whitelist_ips(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": ["1.2.3.4", "5.6.7.8"]})
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_whitelist_ips()
+    install_fake_request(client, mock_resp)
+    out = await client.list_whitelist_ips()
     assert out == ["1.2.3.4", "5.6.7.8"]
 
 
-async def test_async_list_countries(async_client_coverage):
+async def test_async_list_countries(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -427,14 +412,12 @@ async def test_async_list_countries(async_client_coverage):
             "data": [{"country_code": "us", "country_name": "United States"}],
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_countries()
+    install_fake_request(client, mock_resp)
+    out = await client.list_countries()
     assert len(out) == 1 and out[0]["country_code"] == "us"
 
 
-async def test_async_list_states(async_client_coverage):
+async def test_async_list_states(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -442,14 +425,12 @@ async def test_async_list_states(async_client_coverage):
             "data": [{"state_code": "wa", "state_name": "Washington"}],
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_states("us")
+    install_fake_request(client, mock_resp)
+    out = await client.list_states("us")
     assert len(out) == 1 and out[0]["state_code"] == "wa"
 
 
-async def test_async_list_proxy_servers(async_client_coverage):
+async def test_async_list_proxy_servers(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {
@@ -457,26 +438,24 @@ async def test_async_list_proxy_servers(async_client_coverage):
             "data": [{"ip": "1.2.3.4", "port": 9999, "username": "u", "password": "p"}],
         }
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.list_proxy_servers(ProxyType.RESIDENTIAL)
+    install_fake_request(client, mock_resp)
+    out = await client.list_proxy_servers(ProxyType.RESIDENTIAL)
     assert len(out) == 1 and out[0].ip == "1.2.3.4"
 
 
-async def test_async_get_proxy_expiration(async_client_coverage):
+async def test_async_get_proxy_expiration(async_client_coverage, install_fake_request):
     client = async_client_coverage
     mock_resp = _async_response_with_json(
         {"code": 200, "data": {"1.2.3.4": 1735689600}}
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        out = await client.get_proxy_expiration("1.2.3.4", ProxyType.RESIDENTIAL)
+    install_fake_request(client, mock_resp)
+    out = await client.get_proxy_expiration("1.2.3.4", ProxyType.RESIDENTIAL)
     assert out["1.2.3.4"] == 1735689600
 
 
-async def test_async_create_scraper_task_advanced(async_client_coverage):
+async def test_async_create_scraper_task_advanced(
+    async_client_coverage, install_fake_request
+):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": {"task_id": "adv_tid"}})
     cfg = ScraperTaskConfig(
@@ -485,14 +464,14 @@ async def test_async_create_scraper_task_advanced(async_client_coverage):
         spider_name="sname",
         parameters={"x": 1},
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        task_id = await client.create_scraper_task_advanced(cfg)
+    install_fake_request(client, mock_resp)
+    task_id = await client.create_scraper_task_advanced(cfg)
     assert task_id == "adv_tid"
 
 
-async def test_async_create_video_task_advanced(async_client_coverage):
+async def test_async_create_video_task_advanced(
+    async_client_coverage, install_fake_request
+):
     client = async_client_coverage
     mock_resp = _async_response_with_json({"code": 200, "data": {"task_id": "vid_tid"}})
     cfg = VideoTaskConfig(
@@ -502,10 +481,8 @@ async def test_async_create_video_task_advanced(async_client_coverage):
         parameters={},
         common_settings=CommonSettings(),
     )
-    with patch.object(
-        client._http, "request", new_callable=AsyncMock, return_value=mock_resp
-    ):
-        task_id = await client.create_video_task_advanced(cfg)
+    install_fake_request(client, mock_resp)
+    task_id = await client.create_video_task_advanced(cfg)
     assert task_id == "vid_tid"
 
 
@@ -2,78 +2,55 @@
 Tests for AsyncThordataClient error handling.
 """
 
-from collections.abc import Generator
 from typing import Any
-from unittest.mock import MagicMock
 
 import pytest
+import pytest_asyncio
 
 from thordata import AsyncThordataClient, ThordataAuthError, ThordataRateLimitError
 
+from ._stubs import DummyAsyncResponse
 
-class DummyAsyncResponse:
-    """
-    Minimal async fake response object for aiohttp.
-    Made awaitable to support 'await session.request(...)'.
-    """
-
-    def __init__(self, json_data: dict[str, Any], status: int = 200) -> None:
-        self._json_data = json_data
-        self.status = status
-
-    # Support 'await response' pattern used by session.request in new core
-    def __await__(self) -> Generator[Any, None, "DummyAsyncResponse"]:
-        yield
-        return self
 
-    async def __aenter__(self) -> "DummyAsyncResponse":
-        return self
+class _StubSession:
+    """Open aiohttp session stand-in whose request() returns one response."""
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:
-        return None
+    __slots__ = ("closed", "_response")
 
-    def raise_for_status(self) -> None:
-        pass
+    def __init__(self, response: DummyAsyncResponse) -> None:
+        self.closed = False
+        self._response = response
 
-    async def json(self, **kwargs: Any) -> dict[str, Any]:
-        return self._json_data
+    def request(self, *args: Any, **kwargs: Any) -> DummyAsyncResponse:
+        return self._response
 
-    async def read(self) -> bytes:
-        return b""
 
-    async def text(self) -> str:
-        import json
+# One client (and aiohttp session) for the module; tests swap in stub sessions.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-        return json.dumps(self._json_data)
 
-
-@pytest.mark.asyncio
-async def test_async_universal_scrape_rate_limit_error() -> None:
-    """
-    When Universal API returns JSON with code=402, the async client should raise
-    ThordataRateLimitError.
-    """
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def err_client():
     client = AsyncThordataClient(
         scraper_token="SCRAPER_TOKEN",
         public_token="PUBLIC_TOKEN",
         public_key="PUBLIC_KEY",
     )
-
-    # Initialize the http wrapper manually since we aren't using 'async with'
     await client._http._ensure_session()
+    yield client
+    await client.close()
 
-    # Create a mock session with closed=False
-    mock_session = MagicMock()
-    mock_session.closed = False
 
-    # Mock response
+async def test_async_universal_scrape_rate_limit_error(err_client, monkeypatch) -> None:
+    """
+    When Universal API returns JSON with code=402, the async client should raise
+    ThordataRateLimitError.
+    """
+    # Inject a stub session whose request() returns the awaitable response;
+    # monkeypatch restores the shared client's real session afterwards.
+    client = err_client
     mock_response = DummyAsyncResponse({"code": 402, "msg": "Insufficient balance"})
-
-    # Configure mock_session.request to return the awaitable mock_response
-    mock_session.request.return_value = mock_response
-
-    # Inject mock into the _http wrapper
-    client._http._session = mock_session
+    monkeypatch.setattr(client._http, "_session", _StubSession(mock_response))
 
     with pytest.raises(ThordataRateLimitError) as exc_info:
         await client.universal_scrape("https://example.com")
@@ -84,29 +61,14 @@ async def test_async_universal_scrape_rate_limit_error() -> None:
     assert err.payload.get("msg") == "Insufficient balance"
 
 
-@pytest.mark.asyncio
-async def test_async_create_scraper_task_auth_error() -> None:
+async def test_async_create_scraper_task_auth_error(err_client, monkeypatch) -> None:
     """
     When Web Scraper API returns JSON with code=401, the async client should raise
     ThordataAuthError.
     """
-    client = AsyncThordataClient(
-        scraper_token="SCRAPER_TOKEN",
-        public_token="PUBLIC_TOKEN",
-        public_key="PUBLIC_KEY",
-    )
-
-    await client._http._ensure_session()
-
-    mock_session = MagicMock()
-    mock_session.closed = False
+    client = err_client
     mock_response = DummyAsyncResponse({"code": 401, "msg": "Unauthorized"})
-
-    # Mock request return value
-    mock_session.request.return_value = mock_response
-
-    # Inject mock
-    client._http._session = mock_session
+    monkeypatch.setattr(client._http, "_session", _StubSession(mock_response))
 
     with pytest.raises(ThordataAuthError) as exc_info:
         await client.create_scraper_task(
@@ -3,7 +3,8 @@ Tests for batch task creation logic in ThordataClient.
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -11,32 +12,42 @@ from thordata import ThordataClient
 from thordata.types import ScraperTaskConfig
 
 
+@pytest.fixture(scope="module")
+def client():
+    return ThordataClient(
+        scraper_token="test_scraper_token",
+        public_token="test_public_token",
+        public_key="test_public_key",
+    )
+
+
+def _recording_request(response):
+    """Fake _api_request_with_retry returning response; records call kwargs."""
+    calls = []
+
+    def fake(*args, **kwargs):
+        calls.append(kwargs)
+        return response
+
+    return fake, calls
+
+
 class TestBatchCreation:
     """Test suite for verifying batch vs single task creation payloads."""
 
-    @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="test_scraper_token",
-            public_token="test_public_token",
-            public_key="test_public_key",
-        )
-
     def test_single_dict_parameter(self, client):
         """Verify that a single dict parameter is wrapped in a list [params]."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "code": 200,
-            "data": {"task_id": "single_task_123"},
-        }
+        mock_response = SimpleNamespace(
+            status_code=200,
+            raise_for_status=lambda: None,
+            json=lambda: {"code": 200, "data": {"task_id": "single_task_123"}},
+        )
 
         # Parameters as a single dict
         params = {"url": "https://example.com", "depth": 1}
 
-        with patch.object(
-            client, "_api_request_with_retry", return_value=mock_response
-        ) as mock_req:
+        fake_request, calls = _recording_request(mock_response)
+        with patch.object(client, "_api_request_with_retry", new=fake_request):
             task_id = client.create_scraper_task(
                 file_name="test_single",
                 spider_id="s1",
@@ -47,9 +58,8 @@ class TestBatchCreation:
             assert task_id == "single_task_123"
 
             # Verify payload
-            mock_req.assert_called_once()
-            args, kwargs = mock_req.call_args
-            data = kwargs["data"]
+            assert len(calls) == 1
+            data = calls[0]["data"]
 
             # spider_parameters should be a JSON string of a LIST containing the dict
             assert "spider_parameters" in data
@@ -60,12 +70,11 @@ class TestBatchCreation:
 
     def test_batch_list_parameter(self, client):
         """Verify that a list of parameters is sent as is (serialized)."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "code": 200,
-            "data": {"task_id": "batch_task_456"},
-        }
+        mock_response = SimpleNamespace(
+            status_code=200,
+            raise_for_status=lambda: None,
+            json=lambda: {"code": 200, "data": {"task_id": "batch_task_456"}},
+        )
 
         # Parameters as a list of dicts
         params = [
@@ -73,9 +82,8 @@ class TestBatchCreation:
             {"url": "https://example.com/2", "depth": 2},
         ]
 
-        with patch.object(
-            client, "_api_request_with_retry", return_value=mock_response
-        ) as mock_req:
+        fake_request, calls = _recording_request(mock_response)
+        with patch.object(client, "_api_request_with_retry", new=fake_request):
             task_id = client.create_scraper_task(
                 file_name="test_batch",
                 spider_id="s1",
@@ -86,9 +94,8 @@ class TestBatchCreation:
             assert task_id == "batch_task_456"
 
             # Verify payload
-            mock_req.assert_called_once()
-            args, kwargs = mock_req.call_args
-            data = kwargs["data"]
+            assert len(calls) == 1
+            data = calls[0]["data"]
 
             assert "spider_parameters" in data
             parsed_params = json.loads(data["spider_parameters"])
@@ -103,7 +110,7 @@ class TestBatchCreation:
             file_name="f", spider_id="id", spider_name="name", parameters={"a": 1}
         )
         payload_single = config_single.to_payload()
-        assert json.loads(payload_single["spider_parameters"]) == [{"a": 1}]
+        assert payload_single["spider_parameters"] == '[{"a":1}]'
 
         # Batch
         config_batch = ScraperTaskConfig(
@@ -113,4 +120,4 @@ class TestBatchCreation:
             parameters=[{"a": 1}, {"b": 2}],
         )
         payload_batch = config_batch.to_payload()
-        assert json.loads(payload_batch["spider_parameters"]) == [{"a": 1}, {"b": 2}]
+        assert payload_batch["spider_parameters"] == '[{"a":1},{"b":2}]'
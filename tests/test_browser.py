@@ -4,49 +4,55 @@ from __future__ import annotations
 
 import pytest
 
-try:
-    import playwright.async_api  # noqa: F401
+from thordata import AsyncThordataClient
+from thordata.browser import BrowserConnectionError, BrowserError
 
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
 
-from thordata import AsyncThordataClient
+@pytest.fixture
+def session_cls():
+    """The BrowserSession class (requested after the classes' Playwright skip)."""
+    from thordata.browser import BrowserSession
 
-if PLAYWRIGHT_AVAILABLE:
-    from thordata.browser import BrowserConnectionError, BrowserError, BrowserSession
-else:
-    from thordata.browser import BrowserConnectionError, BrowserError
+    return BrowserSession
 
 
-@pytest.mark.skipif(not PLAYWRIGHT_AVAILABLE, reason="Playwright not installed")
 class TestBrowserSession:
     """Tests for BrowserSession class."""
 
+    @pytest.fixture(autouse=True)
+    def _playwright(self):
+        pytest.importorskip("playwright.async_api", reason="Playwright not installed")
+
     @pytest.fixture
     def client(self):
         """Create a test client."""
         return AsyncThordataClient(scraper_token="test_token")
 
-    def test_browser_session_init(self, client):
+    def test_browser_session_init(self, session_cls, client):
         """Test BrowserSession initialization."""
-        session = BrowserSession(client)
+        session = session_cls(client)
         assert session._client == client
         assert session._playwright is None
 
-    def test_browser_session_with_credentials(self, client):
+    def test_browser_session_with_credentials(self, session_cls, client):
         """Test BrowserSession with credentials."""
-        session = BrowserSession(client, username="test_user", password="test_pass")
+        session = session_cls(client, username="test_user", password="test_pass")
         assert session._username == "test_user"
         assert session._password == "test_pass"
 
-    def test_get_domain(self):
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://example.com/page", "example.com"),
+            ("http://test.org", "test.org"),
+            ("invalid", "default"),
+        ],
+    )
+    def test_get_domain(self, session_cls, url, expected):
         """Test domain extraction."""
-        assert BrowserSession._get_domain("https://example.com/page") == "example.com"
-        assert BrowserSession._get_domain("http://test.org") == "test.org"
-        assert BrowserSession._get_domain("invalid") == "default"
+        assert session_cls._get_domain(url) == expected
 
-    def test_filter_snapshot(self):
+    def test_filter_snapshot(self, session_cls):
         """Test snapshot filtering."""
         snapshot = """
         - button "Click me" [ref=1]
@@ -55,33 +61,36 @@ class TestBrowserSession:
         - link "Go here" [ref=3]
           /url: "https://example.com/page"
         """
-        filtered = BrowserSession._filter_snapshot(snapshot)
+        filtered = session_cls._filter_snapshot(snapshot)
         assert "button" in filtered
         assert "link" in filtered
         assert "div" not in filtered
 
-    def test_limit_snapshot_items(self):
+    def test_limit_snapshot_items(self, session_cls):
         """Test snapshot item limiting."""
         snapshot = '- button "1" [ref=1]\n- button "2" [ref=2]\n- button "3" [ref=3]'
-        limited = BrowserSession._limit_snapshot_items(snapshot, max_items=2)
+        limited = session_cls._limit_snapshot_items(snapshot, max_items=2)
         assert 'button "1"' in limited
         assert 'button "2"' in limited
         assert 'button "3"' not in limited
 
 
-@pytest.mark.skipif(not PLAYWRIGHT_AVAILABLE, reason="Playwright not installed")
 class TestBrowserClientIntegration:
     """Tests for browser integration with AsyncThordataClient."""
 
+    @pytest.fixture(autouse=True)
+    def _playwright(self):
+        pytest.importorskip("playwright.async_api", reason="Playwright not installed")
+
     @pytest.fixture
     def client(self):
         """Create a test client."""
         return AsyncThordataClient(scraper_token="test_token")
 
-    def test_browser_property(self, client):
+    def test_browser_property(self, session_cls, client):
         """Test browser property access."""
         session = client.browser
-        assert isinstance(session, BrowserSession)
+        assert isinstance(session, session_cls)
         assert session._client == client
 
     def test_browser_property_import_error(self, monkeypatch):
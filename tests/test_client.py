@@ -2,8 +2,9 @@
 Tests for thordata.client module.
 """
 
+import json
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -18,15 +19,19 @@ from thordata.types import (
     VideoTaskConfig,
 )
 
+from ._stubs import StubResponse
+
 
 def _mock_response(json_data, status_code=200, text="", content=None):
-    r = MagicMock()
-    r.status_code = status_code
-    r.raise_for_status = MagicMock()
-    r.json.return_value = json_data
-    r.text = text or str(json_data)
-    r.content = content or (text.encode() if text else b"")
-    return r
+    if content is None:
+        content = text.encode() if text else json.dumps(json_data).encode()
+    return StubResponse(json_data, status_code, text or str(json_data), content)
+
+
+# Request objects are never mutated by the client, so tests share one of each.
+_SERP_REQ = SerpRequest(query="test", engine="google")
+_UNI_REQ_HTML = UniversalScrapeRequest(url="https://example.com", output_format="html")
+_UNI_REQ_1 = UniversalScrapeRequest(url="https://example.com/1")
 
 
 class TestClientInitialization:
@@ -68,18 +73,29 @@ class TestClientInitialization:
         with ThordataClient(scraper_token="test") as client:
             assert client is not None
 
+    def test_namespaces_built_on_first_access(self):
+        client = ThordataClient(scraper_token="test")
+        assert "unlimited" not in vars(client)
+        assert client.unlimited is client.unlimited
+        assert "unlimited" in vars(client)
+
+    def test_api_connection_pool_size(self):
+        """API adapter pool is sized for threaded use and configurable."""
+        client = ThordataClient(scraper_token="test")
+        adapter = client._http._session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 100
+
+        client = ThordataClient(scraper_token="test", pool_maxsize=32)
+        adapter = client._http._session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 32
+
 
 class TestClientMethods:
     """Tests for ThordataClient methods."""
 
     @pytest.fixture
-    def client(self):
-        """Create a client for testing."""
-        return ThordataClient(
-            scraper_token="test_token",
-            public_token="pub_token",
-            public_key="pub_key",
-        )
+    def client(self, full_client):
+        return full_client
 
     def test_build_proxy_url(self, client):
         """Test build_proxy_url method."""
@@ -114,27 +130,22 @@ class TestClientMethods:
         with pytest.raises(ThordataConfigError, match="public_token and public_key"):
             client.get_task_status("some_task_id")
 
-    def test_list_tasks(self, client):
+    def test_list_tasks(self, client, api_stub):
         """Test list_tasks method."""
-        # Mock the _api_request_with_retry method directly
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
-            "code": 200,
-            "data": {
-                "count": 5,
-                "list": [
-                    {"task_id": "task_1", "status": "ready"},
-                    {"task_id": "task_2", "status": "running"},
-                ],
-            },
-        }
+        api_stub.response = _mock_response(
+            {
+                "code": 200,
+                "data": {
+                    "count": 5,
+                    "list": [
+                        {"task_id": "task_1", "status": "ready"},
+                        {"task_id": "task_2", "status": "running"},
+                    ],
+                },
+            }
+        )
 
-        with patch.object(
-            client, "_api_request_with_retry", return_value=mock_response
-        ):
-            result = client.list_tasks(page=1, size=10)
+        result = client.list_tasks(page=1, size=10)
 
         assert result["count"] == 5
         assert len(result["list"]) == 2
@@ -152,28 +163,18 @@ class TestClientSERPAndUniversal:
     """SERP and Universal API success paths."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_serp_search_advanced_success(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"organic": []}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            req = SerpRequest(query="test", engine="google")
-            out = client.serp_search_advanced(req)
+    def test_serp_search_advanced_success(self, client, api_stub):
+        api_stub.response = _mock_response({"code": 200, "data": {"organic": []}})
+        out = client.serp_search_advanced(_SERP_REQ)
         assert "data" in out and "organic" in out["data"]
         assert out["data"]["organic"] == []
 
-    def test_universal_scrape_advanced_success_html(self, client):
-        mock_r = _mock_response({"code": 200, "html": "<body>ok</body>"})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            req = UniversalScrapeRequest(
-                url="https://example.com", output_format="html"
-            )
-            out = client.universal_scrape_advanced(req)
+    def test_universal_scrape_advanced_success_html(self, client, api_stub):
+        api_stub.response = _mock_response({"code": 200, "html": "<body>ok</body>"})
+        out = client.universal_scrape_advanced(_UNI_REQ_HTML)
         assert out == "<body>ok</body>"
 
 
@@ -181,44 +182,36 @@ class TestClientWebScraperTaskAPI:
     """Web Scraper task status, result, list, wait, run."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_get_task_status(self, client):
-        mock_r = _mock_response(
+    def test_get_task_status(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": [{"task_id": "tid1", "status": "ready"}],
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            status = client.get_task_status("tid1")
+        status = client.get_task_status("tid1")
         assert status == "ready"
 
-    def test_get_latest_task_status(self, client):
-        mock_r = _mock_response(
+    def test_get_latest_task_status(self, client, api_stub):
+        api_stub.response = _mock_response(
             {"code": 200, "data": {"task_id": "t1", "status": "running"}}
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            data = client.get_latest_task_status()
+        data = client.get_latest_task_status()
         assert data["task_id"] == "t1" and data["status"] == "running"
 
-    def test_safe_get_task_status_returns_error_on_failure(self, client):
-        mock_r = _mock_response({"code": 401, "msg": "Unauthorized"})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            status = client.safe_get_task_status("tid1")
+    def test_safe_get_task_status_returns_error_on_failure(self, client, api_stub):
+        api_stub.response = _mock_response({"code": 401, "msg": "Unauthorized"})
+        status = client.safe_get_task_status("tid1")
         assert status == "error"
 
-    def test_get_task_result(self, client):
-        mock_r = _mock_response(
+    def test_get_task_result(self, client, api_stub):
+        api_stub.response = _mock_response(
             {"code": 200, "data": {"download": "https://cdn.example/out.json"}}
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            url = client.get_task_result("tid1", file_type="json")
+        url = client.get_task_result("tid1", file_type="json")
         assert url == "https://cdn.example/out.json"
 
     def test_wait_for_task_returns_on_ready(self, client):
@@ -247,12 +240,8 @@ class TestClientWebScraperTools:
     """Discovery and convenience helpers for Web Scraper tools."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
     def test_list_tools_and_groups_basic(self, client):
         out = client.list_tools()
@@ -331,8 +320,8 @@ class TestClientUniversalBatch:
     """Universal Scrape batch helper."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(scraper_token="st")
+    def client(self, scraper_only_client):
+        return scraper_only_client
 
     def test_universal_scrape_batch_mixed_requests(self, client, monkeypatch):
         # Patch advanced call to avoid real HTTP
@@ -341,9 +330,8 @@ class TestClientUniversalBatch:
 
         monkeypatch.setattr(client, "universal_scrape_advanced", _fake_universal_adv)
 
-        req_obj = UniversalScrapeRequest(url="https://example.com/1")
         req_dict = {"url": "https://example.com/2", "js_render": True}
-        results = client.universal_scrape_batch([req_obj, req_dict], concurrency=2)
+        results = client.universal_scrape_batch([_UNI_REQ_1, req_dict], concurrency=2)
         assert len(results) == 2
         assert results[0]["ok"] and results[0]["output"].startswith("HTML for")
         assert results[1]["ok"] and results[1]["output"].startswith("HTML for")
@@ -353,15 +341,11 @@ class TestClientAccountAndUsage:
     """Account, usage stats, traffic and wallet balance, proxy user usage."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_get_usage_statistics(self, client):
-        mock_r = _mock_response(
+    def test_get_usage_statistics(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": {
@@ -373,14 +357,13 @@ class TestClientAccountAndUsage:
                 },
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            stats = client.get_usage_statistics("2024-01-01", "2024-01-07")
+        stats = client.get_usage_statistics("2024-01-01", "2024-01-07")
         assert stats.total_usage_traffic == 1000
         assert stats.traffic_balance == 2000
         assert stats.query_days == 7
 
-    def test_get_usage_statistics_with_date_objects(self, client):
-        mock_r = _mock_response(
+    def test_get_usage_statistics_with_date_objects(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": {
@@ -392,39 +375,22 @@ class TestClientAccountAndUsage:
                 },
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            stats = client.get_usage_statistics(date(2024, 1, 1), date(2024, 1, 7))
+        stats = client.get_usage_statistics(date(2024, 1, 1), date(2024, 1, 7))
         assert stats.query_days == 0
 
-    def test_get_traffic_balance(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"traffic_balance": 123.45}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            bal = client.get_traffic_balance()
-        assert bal == 123.45
-
-    def test_get_wallet_balance(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"balance": 99.99}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            bal = client.get_wallet_balance()
-        assert bal == 99.99
-
-    def test_get_proxy_user_usage(self, client):
-        mock_r = _mock_response(
+    def test_get_proxy_user_usage(self, client, api_stub):
+        api_stub.response = _mock_response(
             {"code": 200, "data": [{"date": "2024-01-01", "usage": 100}]}
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.get_proxy_user_usage("u1", "2024-01-01", "2024-01-07")
+        out = client.get_proxy_user_usage("u1", "2024-01-01", "2024-01-07")
         assert len(out) == 1
         assert out[0]["date"] == "2024-01-01"
 
-    def test_get_proxy_user_usage_hour(self, client):
-        mock_r = _mock_response(
+    def test_get_proxy_user_usage_hour(self, client, api_stub):
+        api_stub.response = _mock_response(
             {"code": 200, "data": {"data": [{"hour": "2024-01-01 12", "usage": 10}]}}
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.get_proxy_user_usage_hour(
-                "u1", "2024-01-01 00", "2024-01-01 23"
-            )
+        out = client.get_proxy_user_usage_hour("u1", "2024-01-01 00", "2024-01-01 23")
         assert len(out) == 1
         assert out[0]["hour"] == "2024-01-01 12"
 
@@ -433,12 +399,8 @@ class TestClientLocationsAndASN:
     """list_states, list_cities, list_asn (via _get_locations)."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
     def test_list_states(self, client):
         with patch.object(
@@ -465,55 +427,89 @@ class TestClientLocationsAndASN:
         assert out[0]["asn"] == "12345"
 
 
-class TestClientWhitelist:
-    """Whitelist IP add, delete, list."""
+# Endpoints that unwrap the response payload without further parsing:
+# (method, args, kwargs, response data, expected return value).
+_SIMPLE_ENDPOINT_CASES = [
+    pytest.param(
+        "get_traffic_balance",
+        (),
+        {},
+        {"traffic_balance": 123.45},
+        123.45,
+        id="traffic_balance",
+    ),
+    pytest.param(
+        "get_wallet_balance", (), {}, {"balance": 99.99}, 99.99, id="wallet_balance"
+    ),
+    pytest.param(
+        "add_whitelist_ip",
+        ("1.2.3.4",),
+        {"proxy_type": ProxyType.RESIDENTIAL},
+        {"ip": "1.2.3.4"},
+        {"ip": "1.2.3.4"},
+        id="add_whitelist_ip",
+    ),
+    pytest.param(
+        "delete_whitelist_ip", ("1.2.3.4",), {}, {}, {}, id="delete_whitelist_ip"
+    ),
+    pytest.param(
+        "list_whitelist_ips",
+        (),
+        {},
+        ["1.2.3.4", "5.6.7.8"],
+        ["1.2.3.4", "5.6.7.8"],
+        id="list_whitelist_ips",
+    ),
+    pytest.param(
+        "list_whitelist_ips",
+        (),
+        {},
+        [{"ip": "1.2.3.4"}],
+        ["1.2.3.4"],
+        id="list_whitelist_ips_dict_items",
+    ),
+    pytest.param(
+        "create_proxy_user",
+        ("newuser", "pass"),
+        {},
+        {"username": "newuser"},
+        {"username": "newuser"},
+        id="create_proxy_user",
+    ),
+    pytest.param(
+        "update_proxy_user", ("u1", "newpass"), {}, {}, {}, id="update_proxy_user"
+    ),
+    pytest.param("delete_proxy_user", ("u1",), {}, {}, {}, id="delete_proxy_user"),
+]
+
+
+class TestClientSimpleEndpoints:
+    """Balance, whitelist and proxy-user calls that return the payload as-is."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
-
-    def test_add_whitelist_ip(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"ip": "1.2.3.4"}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.add_whitelist_ip("1.2.3.4", proxy_type=ProxyType.RESIDENTIAL)
-        assert out["ip"] == "1.2.3.4"
-
-    def test_delete_whitelist_ip(self, client):
-        mock_r = _mock_response({"code": 200, "data": {}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.delete_whitelist_ip("1.2.3.4")
-        assert isinstance(out, dict)
-
-    def test_list_whitelist_ips(self, client):
-        mock_r = _mock_response({"code": 200, "data": ["1.2.3.4", "5.6.7.8"]})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.list_whitelist_ips()
-        assert out == ["1.2.3.4", "5.6.7.8"]
+    def client(self, full_client):
+        return full_client
 
-    def test_list_whitelist_ips_dict_items(self, client):
-        mock_r = _mock_response({"code": 200, "data": [{"ip": "1.2.3.4"}]})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.list_whitelist_ips()
-        assert out == ["1.2.3.4"]
+    @pytest.mark.parametrize(
+        "method, args, kwargs, data, expected", _SIMPLE_ENDPOINT_CASES
+    )
+    def test_simple_endpoint(
+        self, client, api_stub, method, args, kwargs, data, expected
+    ):
+        api_stub.response = _mock_response({"code": 200, "data": data})
+        out = getattr(client, method)(*args, **kwargs)
+        assert out == expected
 
 
 class TestClientProxyUsers:
-    """Proxy user list, create, update, delete."""
+    """Proxy user list parsing."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_list_proxy_users(self, client):
-        mock_r = _mock_response(
+    def test_list_proxy_users(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": {
@@ -532,44 +528,21 @@ class TestClientProxyUsers:
                 },
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.list_proxy_users()
+        out = client.list_proxy_users()
         assert out.user_count == 1
         assert len(out.users) == 1
         assert out.users[0].username == "u1"
 
-    def test_create_proxy_user(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"username": "newuser"}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.create_proxy_user("newuser", "pass")
-        assert out["username"] == "newuser"
-
-    def test_update_proxy_user(self, client):
-        mock_r = _mock_response({"code": 200, "data": {}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.update_proxy_user("u1", "newpass")
-        assert isinstance(out, dict)
-
-    def test_delete_proxy_user(self, client):
-        mock_r = _mock_response({"code": 200, "data": {}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.delete_proxy_user("u1")
-        assert isinstance(out, dict)
-
 
 class TestClientProxyServersAndExpiration:
     """list_proxy_servers, get_proxy_expiration."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_list_proxy_servers(self, client):
-        mock_r = _mock_response(
+    def test_list_proxy_servers(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": [
@@ -577,21 +550,25 @@ class TestClientProxyServersAndExpiration:
                 ],
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.list_proxy_servers(ProxyType.RESIDENTIAL)
+        out = client.list_proxy_servers(ProxyType.RESIDENTIAL)
         assert len(out) == 1
         assert out[0].ip == "1.2.3.4" and out[0].port == 9999
 
-    def test_get_proxy_expiration(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"1.2.3.4": 1735689600}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.get_proxy_expiration("1.2.3.4", ProxyType.RESIDENTIAL)
+    def test_get_proxy_expiration(self, client, api_stub):
+        api_stub.response = _mock_response(
+            {"code": 200, "data": {"1.2.3.4": 1735689600}}
+        )
+        out = client.get_proxy_expiration("1.2.3.4", ProxyType.RESIDENTIAL)
         assert out["1.2.3.4"] == 1735689600
 
 
 class TestClientBrowserAndExtractIP:
     """get_browser_connection_url, extract_ip_list."""
 
+    @pytest.fixture
+    def client(self, full_client):
+        return full_client
+
     def test_get_browser_connection_url_from_args(self):
         client = ThordataClient(scraper_token="t")
         url = client.get_browser_connection_url(username="buser", password="bpass")
@@ -607,26 +584,16 @@ class TestClientBrowserAndExtractIP:
         ):
             client.get_browser_connection_url()
 
-    def test_extract_ip_list_txt(self):
-        client = ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
+    def test_extract_ip_list_txt(self, client, api_stub):
+        api_stub.response = _mock_response(
+            ValueError("not json"), text="1.2.3.4:8080\r\n5.6.7.8:8080"
         )
-        mock_r = _mock_response({}, text="1.2.3.4:8080\r\n5.6.7.8:8080")
-        mock_r.json.side_effect = ValueError("not json")
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.extract_ip_list(num=2, return_type="txt", sep="\r\n")
+        out = client.extract_ip_list(num=2, return_type="txt", sep="\r\n")
         assert len(out) == 2
         assert "1.2.3.4:8080" in out and "5.6.7.8:8080" in out
 
-    def test_extract_ip_list_json(self):
-        client = ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
-        mock_r = _mock_response(
+    def test_extract_ip_list_json(self, client, api_stub):
+        api_stub.response = _mock_response(
             {
                 "code": 200,
                 "data": [
@@ -635,71 +602,62 @@ class TestClientBrowserAndExtractIP:
                 ],
             }
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            out = client.extract_ip_list(num=2, return_type="json")
+        out = client.extract_ip_list(num=2, return_type="json")
         assert len(out) == 2
         assert any("1.2.3.4" in s for s in out)
         assert any("5.6.7.8" in s for s in out)
 
-    def test_extract_ip_list_unlimited_uses_unlimited_api_and_username(self):
-        client = ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
-        mock_r = _mock_response(
+    def test_extract_ip_list_unlimited_uses_unlimited_api_and_username(
+        self, client, api_stub
+    ):
+        api_stub.response = _mock_response(
             {"code": 200, "data": [{"ip": "1.2.3.4", "port": 9999}]}
         )
-        with (
-            patch.object(client, "_api_request_with_retry", return_value=mock_r) as m,
-            patch(
-                "thordata.client.os.getenv",
-                side_effect=lambda k, d=None: {
-                    "THORDATA_UNLIMITED_USERNAME": "unlimited_user"
-                }.get(k, d),
-            ),
+        with patch(
+            "thordata.client.os.getenv",
+            side_effect=lambda k, d=None: {
+                "THORDATA_UNLIMITED_USERNAME": "unlimited_user"
+            }.get(k, d),
         ):
             out = client.extract_ip_list(num=1, return_type="json", product="unlimited")
         assert len(out) == 1
-        call_args = m.call_args
-        assert "unlimited_api" in str(call_args[0][1])
-        if call_args[1].get("params"):
-            assert call_args[1]["params"].get("td-customer") == "unlimited_user"
+        args, kwargs = api_stub.calls[-1]
+        assert "unlimited_api" in str(args[1])
+        if kwargs.get("params"):
+            assert kwargs["params"].get("td-customer") == "unlimited_user"
 
 
 class TestClientCreateTask:
     """create_scraper_task, create_scraper_task_advanced, create_video_task."""
 
     @pytest.fixture
-    def client(self):
-        return ThordataClient(
-            scraper_token="st",
-            public_token="pt",
-            public_key="pk",
-        )
+    def client(self, full_client):
+        return full_client
 
-    def test_create_scraper_task(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"task_id": "tid123"}})
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            task_id = client.create_scraper_task(
-                "f.json", "spider_id", "spider_name", {"k": "v"}
-            )
+    def test_create_scraper_task(self, client, api_stub):
+        api_stub.response = _mock_response({"code": 200, "data": {"task_id": "tid123"}})
+        task_id = client.create_scraper_task(
+            "f.json", "spider_id", "spider_name", {"k": "v"}
+        )
         assert task_id == "tid123"
 
-    def test_create_scraper_task_advanced(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"task_id": "adv_tid"}})
+    def test_create_scraper_task_advanced(self, client, api_stub):
+        api_stub.response = _mock_response(
+            {"code": 200, "data": {"task_id": "adv_tid"}}
+        )
         cfg = ScraperTaskConfig(
             file_name="f.json",
             spider_id="sid",
             spider_name="sname",
             parameters={"x": 1},
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            task_id = client.create_scraper_task_advanced(cfg)
+        task_id = client.create_scraper_task_advanced(cfg)
         assert task_id == "adv_tid"
 
-    def test_create_video_task_advanced(self, client):
-        mock_r = _mock_response({"code": 200, "data": {"task_id": "vid_tid"}})
+    def test_create_video_task_advanced(self, client, api_stub):
+        api_stub.response = _mock_response(
+            {"code": 200, "data": {"task_id": "vid_tid"}}
+        )
         cfg = VideoTaskConfig(
             file_name="v.json",
             spider_id="vid",
@@ -707,6 +665,5 @@ class TestClientCreateTask:
             parameters={},
             common_settings=CommonSettings(),
         )
-        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
-            task_id = client.create_video_task_advanced(cfg)
+        task_id = client.create_video_task_advanced(cfg)
         assert task_id == "vid_tid"
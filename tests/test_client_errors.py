@@ -37,7 +37,7 @@ class DummyResponse:
 
     @property
     def content(self) -> bytes:
-        return b""
+        return self.text.encode("utf-8")
 
 
 def _make_client() -> ThordataClient:
@@ -8,12 +8,14 @@ from thordata.enums import (
     Continent,
     Country,
     Engine,
+    Engines,
     GoogleSearchType,
     ProxyType,
     TaskStatus,
     normalize_enum_value,
 )
 from thordata.models import ProxyProduct  # ProxyProduct re-exported from models
+from thordata.types import is_failure_status, is_success_status, is_terminal_status
 
 
 class TestEngine:
@@ -30,6 +32,18 @@ class TestEngine:
         assert isinstance(Engine.GOOGLE, str)
         assert Engine.GOOGLE == "google"
 
+    def test_engines_constants_match_enum(self):
+        """Test that the plain-str Engines namespace mirrors Engine."""
+        assert {e.value for e in Engine} == Engines.ALL
+        constants = {
+            name: value
+            for name, value in vars(Engines).items()
+            if name.isupper() and name != "ALL"
+        }
+        assert constants == {e.name: e.value for e in Engine}
+        assert type(Engines.GOOGLE) is str
+        assert Engines.GOOGLE_NEWS == Engine.GOOGLE_NEWS
+
 
 class TestGoogleSearchType:
     """Tests for GoogleSearchType enum."""
@@ -82,6 +96,12 @@ class TestCountry:
         assert Country.GB.value == "gb"
         assert Country.JP.value == "jp"
 
+    def test_country_lookup_by_value(self):
+        """Test members behave as str and resolve by value."""
+        assert Country("de") is Country.DE
+        assert isinstance(Country.US, str)
+        assert len(Country) == 54
+
 
 class TestTaskStatus:
     """Tests for TaskStatus enum."""
@@ -106,6 +126,13 @@ class TestTaskStatus:
         assert TaskStatus.is_failure(TaskStatus.ERROR) is True
         assert TaskStatus.is_failure(TaskStatus.SUCCESS) is False
 
+    def test_module_level_checks_match_classmethods(self):
+        """Test the plain-function status checks agree with TaskStatus."""
+        for status in TaskStatus:
+            assert is_terminal_status(status) is TaskStatus.is_terminal(status)
+            assert is_success_status(status) is TaskStatus.is_success(status)
+            assert is_failure_status(status) is TaskStatus.is_failure(status)
+
 
 class TestNormalizeEnumValue:
     """Tests for normalize_enum_value function."""
@@ -120,6 +147,11 @@ class TestNormalizeEnumValue:
         result = normalize_enum_value("GOOGLE", Engine)
         assert result == "google"
 
+    def test_with_lowercase_string(self):
+        """Test already-lowercase strings are returned unchanged."""
+        value = "google_news"
+        assert normalize_enum_value(value, Engine) is value
+
     def test_with_invalid_type(self):
         """Test with invalid type."""
         with pytest.raises(TypeError, match="Expected Engine or str"):
@@ -2,16 +2,33 @@
 Tests for thordata.models module.
 """
 
+import base64
+import dataclasses
+import json
+
 import pytest
 
 from thordata.models import (
     ProxyConfig,
     ProxyProduct,
+    ProxyServer,
+    ProxyUserList,
     ScraperTaskConfig,
     SerpRequest,
     StickySession,
+    TaskStatusResponse,
     UniversalScrapeRequest,
 )
+from thordata.types import (
+    BingMapsRequest,
+    Device,
+    Engine,
+    GoogleFlightsRequest,
+    GoogleLensRequest,
+    GoogleNewsRequest,
+    GoogleSearchRequest,
+    GoogleSearchType,
+)
 
 
 class TestProxyConfig:
@@ -76,6 +93,29 @@ class TestProxyConfig:
         expected = "td-customer-testuser-country-fr-asn-AS12322"
         assert config.build_username() == expected
 
+    def test_geo_fields_normalized(self):
+        """Test geo fields and ASN are normalized in the username."""
+        config = ProxyConfig(
+            username="testuser",
+            password="testpass",
+            continent="EU",
+            country="FR",
+            city="Paris",
+            asn="12322",
+        )
+        expected = "td-customer-testuser-continent-eu-country-fr-city-paris-asn-AS12322"
+        assert config.build_username() == expected
+
+    def test_geo_fields_changed_after_construction_are_normalized(self):
+        """Test fields assigned later get the same lowercasing and ASN prefix."""
+        config = ProxyConfig(username="u", password="p")
+        config.country = "DE"
+        config.state = "Berlin"
+        config.asn = "123"
+        assert (
+            config.build_username() == "td-customer-u-country-de-state-berlin-asn-AS123"
+        )
+
     def test_build_proxy_url(self):
         """Test full proxy URL building."""
         config = ProxyConfig(
@@ -88,6 +128,25 @@ class TestProxyConfig:
         assert ":testpass@" in url
         assert "pr.thordata.net" in url
 
+    def test_basic_auth_header(self):
+        """Test the Proxy-Authorization value follows the current fields."""
+        config = ProxyConfig(username="testuser", password="testpass", country="us")
+        expected = base64.b64encode(b"td-customer-testuser-country-us:testpass")
+        assert config.basic_auth_header() == b"Basic " + expected
+
+        config.country = "de"
+        config.session_id = "abc"
+        expected = base64.b64encode(
+            b"td-customer-testuser-country-de-sessid-abc:testpass"
+        )
+        assert config.basic_auth_header() == b"Basic " + expected
+
+    def test_build_proxy_url_escapes_special_chars(self):
+        """Test credentials with reserved characters are percent-encoded."""
+        config = ProxyConfig(username="testuser", password="p@ss:word/1")
+        url = config.build_proxy_url()
+        assert ":p%40ss%3Aword%2F1@" in url
+
     def test_to_proxies_dict(self):
         """Test conversion to proxies dict."""
         config = ProxyConfig(username="testuser", password="testpass")
@@ -151,6 +210,11 @@ class TestProxyConfig:
                 country="usa",  # Should be 2 letters
             )
 
+    def test_non_ascii_country_code_rejected(self):
+        """Test that non-ASCII letters are not accepted as a country code."""
+        with pytest.raises(ValueError, match="Invalid country code"):
+            ProxyConfig(username="testuser", password="testpass", country="ñz")
+
     def test_proxy_product_ports(self):
         """Test that different products have different default ports."""
         residential = ProxyConfig(
@@ -194,6 +258,69 @@ class TestStickySession:
         assert session.session_id == "mycustomid"
 
 
+class TestProxyServer:
+    """Tests for ProxyServer dataclass."""
+
+    def test_is_expired_with_explicit_now(self):
+        """Test expiry check against a caller-supplied timestamp."""
+        server = ProxyServer(
+            ip="1.2.3.4",
+            port=6666,
+            username="u",
+            password="p",
+            expiration_time=1000,
+        )
+        assert server.is_expired(now=1001) is True
+        assert server.is_expired(now=999) is False
+
+    def test_is_expired_without_int_expiration(self):
+        """Test that non-integer expiration values never report expired."""
+        server = ProxyServer(
+            ip="1.2.3.4",
+            port=6666,
+            username="u",
+            password="p",
+            expiration_time="2030-01-01 00:00:00",
+        )
+        assert server.is_expired() is False
+
+
+class TestProxyUserList:
+    """Tests for ProxyUserList parsing."""
+
+    def test_from_dict_parses_users(self):
+        """Test users are parsed from the 'list' key with status coercion."""
+        data = {
+            "limit": 100,
+            "remaining_limit": 40,
+            "list": [
+                {"username": "a", "password": "x", "status": True},
+                {"username": "b", "password": "y", "status": "1"},
+                {"username": "c", "password": "z", "status": "false"},
+            ],
+        }
+        result = ProxyUserList.from_dict(data)
+
+        assert result.user_count == 3
+        assert [u.username for u in result.users] == ["a", "b", "c"]
+        assert [u.status for u in result.users] == [True, True, False]
+
+    def test_from_dict_falls_back_to_data_key(self):
+        """Test users are read from 'data' when 'list' is absent."""
+        result = ProxyUserList.from_dict({"data": [{"username": "a"}]})
+        assert len(result.users) == 1
+        assert result.users[0].traffic_limit == 0
+
+    def test_traffic_unit_conversion(self):
+        """Test KB usage and MB limit are converted to GB."""
+        result = ProxyUserList.from_dict(
+            {"list": [{"traffic_limit": 2048, "usage_traffic": 3 * 1024 * 1024}]}
+        )
+        user = result.users[0]
+        assert user.usage_gb() == 3.0
+        assert user.limit_gb() == 2.0
+
+
 class TestSerpRequest:
     """Tests for SerpRequest dataclass."""
 
@@ -207,6 +334,33 @@ class TestSerpRequest:
         assert payload["num"] == "10"
         assert payload["json"] == "1"
 
+    def test_engine_enum_normalized(self):
+        """Test that Enum and mixed-case engines are normalized in the payload."""
+        request = SerpRequest(query="test", engine=Engine.BING)
+        assert request.to_payload()["engine"] == "bing"
+        payload = SerpRequest(query="test", engine="YANDEX").to_payload()
+        assert payload["engine"] == "yandex"
+
+    def test_enum_field_values_become_plain_strings(self):
+        """Test str-Enum field values are sent as their plain values."""
+        payload = SerpRequest(
+            query="test", search_type=GoogleSearchType.IMAGES, device=Device.MOBILE
+        ).to_payload()
+
+        assert payload["tbm"] == "isch"
+        assert type(payload["device"]) is str
+        assert payload["device"] == "mobile"
+
+    def test_build_payloads_matches_to_payload(self):
+        """Test that batch payload building matches per-request payloads."""
+        requests = [
+            SerpRequest(query="a"),
+            SerpRequest(query="b", engine="yandex", extra_params={"x": "1"}),
+        ]
+        assert SerpRequest.build_payloads(requests) == [
+            r.to_payload() for r in requests
+        ]
+
     def test_yandex_uses_text_param(self):
         """Test that Yandex uses 'text' instead of 'q'."""
         request = SerpRequest(query="test query", engine="yandex")
@@ -256,6 +410,186 @@ class TestSerpRequest:
         assert payload["num"] == "20"
         assert payload["start"] == "40"
 
+    @pytest.mark.parametrize(
+        ("output_format", "expected"),
+        [("json", "1"), ("HTML", "3"), ("light-json", "4"), ("lightjson", "4")],
+    )
+    def test_output_format_mapping(self, output_format, expected):
+        """Test output_format maps to the 'json' payload value."""
+        payload = SerpRequest(query="test", output_format=output_format).to_payload()
+        assert payload["json"] == expected
+
+    def test_both_output_format_warns(self):
+        """Test the unsupported 'both' format still maps but warns."""
+        with pytest.warns(DeprecationWarning, match="json=2"):
+            payload = SerpRequest(query="test", output_format="both").to_payload()
+        assert payload["json"] == "2"
+
+    def test_unknown_output_format_omits_json(self):
+        """Test unknown formats leave 'json' unset (legacy HTML default)."""
+        payload = SerpRequest(query="test", output_format="xml").to_payload()
+        assert "json" not in payload
+
+    def test_passthrough_string_fields(self):
+        """Test optional string fields map to their API keys."""
+        payload = SerpRequest(
+            query="test",
+            google_domain="google.co.uk",
+            countries_filter="countryUS",
+            languages_filter="lang_en",
+            uule="w+CAIQICI",
+            kgmid="/m/0dl567",
+        ).to_payload()
+        assert payload["google_domain"] == "google.co.uk"
+        assert payload["cr"] == "countryUS"
+        assert payload["lr"] == "lang_en"
+        assert payload["uule"] == "w+CAIQICI"
+        assert payload["kgmid"] == "/m/0dl567"
+        assert "location" not in payload
+
+    def test_boolean_flags(self):
+        """Test boolean fields are rendered as the API's string values."""
+        payload = SerpRequest(
+            query="test",
+            safe_search=False,
+            filter_duplicates=True,
+            render_js=True,
+            no_cache=False,
+        ).to_payload()
+        assert payload["safe"] == "off"
+        assert payload["filter"] == "1"
+        assert payload["render_js"] == "True"
+        assert payload["no_cache"] == "False"
+
+    def test_bing_pagination_and_localization(self):
+        """Test Bing engines use first/count/cc/mkt instead of Google params."""
+        request = SerpRequest(
+            query="test",
+            engine="bing_news",
+            start=10,
+            country="US",
+            language="en-US",
+            search_type="news",
+        )
+        payload = request.to_payload()
+        assert payload["first"] == "11"
+        assert payload["count"] == "10"
+        assert payload["cc"] == "us"
+        assert payload["mkt"] == "en-US"
+        assert "num" not in payload
+        assert "tbm" not in payload
+
+    def test_unlisted_google_engine_gets_google_params(self):
+        """Test engines outside the Engine enum still resolve by family."""
+        request = SerpRequest(query="test", engine="google_custom", safe_search=True)
+        payload = request.to_payload()
+        assert payload["safe"] == "active"
+        assert payload["num"] == "10"
+
+    def test_payload_fresh_and_extras_merged(self):
+        """Test each to_payload() call returns a new dict with extras merged."""
+        request = SerpRequest(query="test", extra_params={"foo": "bar"})
+
+        payload = request.to_payload()
+        assert payload["foo"] == "bar"
+        payload["q"] = "mutated"
+        assert request.to_payload()["q"] == "test"
+
+    def test_payload_reflects_field_changes(self):
+        """Test fields assigned after construction show up in the payload."""
+        request = SerpRequest(query="test")
+        request.query = "other"
+        request.num = 20
+        payload = request.to_payload()
+        assert payload["q"] == "other"
+        assert payload["num"] == "20"
+
+
+class TestSerpTypedRequest:
+    """Tests for strongly-typed SERP requests."""
+
+    @pytest.mark.parametrize(
+        "request_obj",
+        [
+            GoogleNewsRequest(query="ai", country="US", extra_params={"x": "1"}),
+            GoogleFlightsRequest(
+                departure_id="PEK", arrival_id="AUS", outbound_date="2025-01-01"
+            ),
+            GoogleLensRequest(url="https://example.com/a.png", query="shoe"),
+            BingMapsRequest(query="coffee", cp="40.7~-74.0"),
+        ],
+    )
+    def test_direct_payload_matches_serp_request(self, request_obj):
+        """Test to_payload() matches the SerpRequest conversion path."""
+        assert request_obj.to_payload() == request_obj.to_serp_request().to_payload()
+
+    def test_serp_request_gets_own_extra_params(self):
+        """Test the converted request does not share the caller's extra_params."""
+        extras = {"x": "1"}
+        request = GoogleNewsRequest(query="ai", extra_params=extras)
+        converted = request.to_serp_request()
+        assert converted.extra_params == extras
+        assert converted.extra_params is not extras
+
+    def test_payload_built_per_call(self):
+        """Test to_payload() returns a fresh dict on each call."""
+        request = GoogleNewsRequest(query="ai", extra_params={"x": "1"})
+        payload = request.to_payload()
+        payload["q"] = "changed"
+        assert request.to_payload()["q"] == "ai"
+        assert request.to_payload()["x"] == "1"
+
+    def test_engine_variant_classes(self):
+        """Test engine-only variants subclass their family's search request."""
+        request = GoogleNewsRequest(query="ai")
+        assert GoogleNewsRequest.__name__ == "GoogleNewsRequest"
+        assert GoogleNewsRequest.__module__ == "thordata.types.serp"
+        assert isinstance(request, GoogleSearchRequest)
+        assert request.engine == "google_news"
+
+    def test_blank_required_field_rejected(self):
+        """Test required fields must be non-blank."""
+        with pytest.raises(ValueError, match="GoogleNewsRequest.query is required"):
+            GoogleNewsRequest(query="   ")
+        with pytest.raises(ValueError, match="arrival_id is required"):
+            GoogleFlightsRequest(
+                departure_id="PEK", arrival_id="", outbound_date="2025-01-01"
+            )
+
+    def test_lens_url_requires_http_scheme(self):
+        """Test GoogleLensRequest only accepts http(s) image URLs."""
+        with pytest.raises(ValueError, match="must start with http"):
+            GoogleLensRequest(url="ftp://example.com/a.png")
+
+    def test_user_dataclass_subclass(self):
+        """Test typed requests can be extended with a plain @dataclass."""
+
+        @dataclasses.dataclass
+        class TaggedSearch(GoogleSearchRequest):
+            tag: str = "x"
+
+            def _mode_params(self):
+                return {**super()._mode_params(), "tag": self.tag}
+
+        request = TaggedSearch(query="ai", tag="a")
+        request.query = "ml"
+        request.tag = "b"
+        payload = request.to_payload()
+        assert payload["q"] == "ml"
+        assert payload["tag"] == "b"
+
+    def test_mode_params_in_payload(self):
+        """Test engine-specific fields are sent as payload params."""
+        payload = GoogleFlightsRequest(
+            departure_id="PEK",
+            arrival_id="AUS",
+            outbound_date="2025-01-01",
+            return_date="2025-01-08",
+        ).to_payload()
+        assert payload["engine"] == "google_flights"
+        assert payload["departure_id"] == "PEK"
+        assert payload["return_date"] == "2025-01-08"
+
 
 class TestUniversalScrapeRequest:
     """Tests for UniversalScrapeRequest dataclass."""
@@ -278,6 +612,15 @@ class TestUniversalScrapeRequest:
         payload = request.to_payload()
         assert payload["js_render"] == "True"
 
+    def test_payload_follows_field_changes(self):
+        """Test the payload reflects fields changed after construction."""
+        request = UniversalScrapeRequest(url="https://example.com")
+        request.url = "https://example.org"
+        request.country = "DE"
+        payload = request.to_payload()
+        assert payload["url"] == "https://example.org"
+        assert payload["country"] == "de"
+
     def test_wait_params(self):
         """Test wait parameters."""
         request = UniversalScrapeRequest(
@@ -289,6 +632,33 @@ class TestUniversalScrapeRequest:
         assert payload["wait"] == "5000"
         assert payload["wait_for"] == ".content"
 
+    def test_multiple_output_formats(self):
+        """Test string and list output formats normalize to the same type."""
+        from_str = UniversalScrapeRequest(
+            url="https://a.com", output_format="PNG, html"
+        )
+        from_list = UniversalScrapeRequest(
+            url="https://a.com", output_format=["png", "HTML"]
+        )
+        assert from_str.to_payload()["type"] == "png,html"
+        assert from_list.to_payload()["type"] == "png,html"
+        assert UniversalScrapeRequest(
+            url="https://a.com", output_format="PNG"
+        )._output_formats == ("png",)
+
+    def test_payload_cache_returns_independent_dicts(self):
+        """Test cached payloads can be mutated without affecting later calls."""
+        request = UniversalScrapeRequest(url="https://example.com", country="US")
+        first = request.to_payload()
+        first["country"] = "de"
+
+        second = UniversalScrapeRequest(
+            url="https://example.com", country="US", extra_params={"x": "1"}
+        ).to_payload()
+        assert second["country"] == "us"
+        assert second["x"] == "1"
+        assert "x" not in request.to_payload()
+
     def test_invalid_output_format(self):
         """Test validation of output format."""
         with pytest.raises(ValueError, match="Invalid output_format"):
@@ -324,3 +694,78 @@ class TestScraperTaskConfig:
         assert payload["spider_name"] == "example.com"
         assert "spider_parameters" in payload
         assert payload["spider_errors"] == "true"
+
+    def test_universal_params_encoded_compactly(self):
+        """Test universal params are sent as compact JSON."""
+        config = ScraperTaskConfig(
+            file_name="test_output",
+            spider_id="test_spider",
+            spider_name="example.com",
+            parameters={"url": "https://example.com"},
+            universal_params={"resolution": "720p"},
+        )
+        assert config.to_payload()["spider_universal"] == '{"resolution":"720p"}'
+
+    def test_universal_params_follow_later_changes(self):
+        """Test universal params changed after construction are still sent."""
+        config = ScraperTaskConfig(
+            file_name="test_output",
+            spider_id="test_spider",
+            spider_name="example.com",
+            parameters={"url": "https://example.com"},
+        )
+        assert "spider_universal" not in config.to_payload()
+
+        config.universal_params = {"resolution": "720p"}
+        config.universal_params["is_subtitles"] = "true"
+        assert (
+            config.to_payload()["spider_universal"]
+            == '{"resolution":"720p","is_subtitles":"true"}'
+        )
+
+    def test_url_parameters_are_decoded(self):
+        """Test percent-encoded URL keys are decoded and others left alone."""
+        config = ScraperTaskConfig(
+            file_name="test_output",
+            spider_id="test_spider",
+            spider_name="example.com",
+            parameters={"url": "https%3A%2F%2Fexample.com", "keyword": "a%20b"},
+        )
+        params = json.loads(config.to_payload()["spider_parameters"])
+
+        assert params == [{"url": "https://example.com", "keyword": "a%20b"}]
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_parameters_json_with_and_without_orjson(self, use_orjson, monkeypatch):
+        """Test encoded parameters are the same JSON whichever encoder is used."""
+        from thordata.types import common
+
+        if not use_orjson:
+            monkeypatch.setattr(common, "_orjson", None)
+        config = ScraperTaskConfig(
+            file_name="test_output",
+            spider_id="test_spider",
+            spider_name="example.com",
+            parameters=[{"keyword": "café", "page": 2}, {1: "int key"}],
+        )
+        params_json = config.to_payload()["spider_parameters"]
+
+        assert " " not in params_json.replace("int key", "")
+        assert json.loads(params_json) == [
+            {"keyword": "café", "page": 2},
+            {"1": "int key"},
+        ]
+
+
+class TestTaskStatusResponse:
+    """Tests for TaskStatusResponse dataclass."""
+
+    def test_status_checks_ignore_case(self):
+        """Test is_complete/is_success accept any status casing."""
+        done = TaskStatusResponse(task_id="t1", status="Ready")
+        failed = TaskStatusResponse(task_id="t2", status="FAILED")
+        running = TaskStatusResponse(task_id="t3", status="running")
+
+        assert done.is_complete() and done.is_success()
+        assert failed.is_complete() and not failed.is_success()
+        assert not running.is_complete()
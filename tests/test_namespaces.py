@@ -27,7 +27,6 @@ class TestNamespaces:
         assert isinstance(client.account, AccountNamespace)
         assert isinstance(client.proxy, ProxyNamespace)
 
-    @pytest.mark.asyncio
     async def test_async_client_namespaces(self):
         async with AsyncThordataClient() as client:
             assert hasattr(client, "universal")
@@ -90,6 +90,12 @@ class TestRetryConfigShouldRetry:
         err = ThordataValidationError("bad", code=400)
         assert config.should_retry(err, attempt=0, status_code=400) is False
 
+    def test_no_retry_on_client_error_status(self):
+        config = RetryConfig(max_retries=5)
+        err = ThordataNetworkError("unauthorized")
+        assert config.should_retry(err, attempt=0, status_code=401) is False
+        assert config.should_retry(err, attempt=0, status_code=429) is True
+
 
 # -----------------------------------------------------------------------------
 # _extract_status_code (via behavior in should_retry / with_retry)
@@ -231,7 +237,6 @@ class TestWithRetrySync:
 
 
 class TestWithRetryAsync:
-    @pytest.mark.asyncio
     async def test_async_success_on_first_call(self):
         config = RetryConfig(max_retries=2)
         call_count = 0
@@ -246,7 +251,6 @@ class TestWithRetryAsync:
         assert result == 42
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_async_success_on_second_call(self):
         config = RetryConfig(max_retries=3, backoff_factor=0.01, jitter=False)
         call_count = 0
@@ -263,7 +267,6 @@ class TestWithRetryAsync:
         assert result == 99
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_async_raises_after_exhausting_retries(self):
         config = RetryConfig(max_retries=1, backoff_factor=0.01, jitter=False)
         call_count = 0
@@ -315,3 +318,29 @@ class TestRetryableRequest:
                 delay = retry.wait()
                 assert delay == 5.0
                 mock_sleep.assert_called_once_with(5.0)
+
+    def test_retry_after_capped_at_max_backoff(self):
+        config = RetryConfig(
+            max_retries=2, backoff_factor=0.01, max_backoff=10.0, jitter=False
+        )
+        with RetryableRequest(config) as retry:
+            retry.should_continue(
+                ThordataRateLimitError("limit", code=429, retry_after=86400)
+            )
+            with patch("thordata.retry.time.sleep") as mock_sleep:
+                assert retry.wait() == 10.0
+                mock_sleep.assert_called_once_with(10.0)
+
+    def test_wait_respects_retry_after_header(self):
+        import requests
+
+        inner = requests.exceptions.HTTPError()
+        inner.response = MagicMock(status_code=429, headers={"Retry-After": "3"})
+        config = RetryConfig(max_retries=2, backoff_factor=0.01, jitter=False)
+        with RetryableRequest(config) as retry:
+            assert retry.should_continue(
+                ThordataNetworkError("x", original_error=inner)
+            )
+            with patch("thordata.retry.time.sleep") as mock_sleep:
+                assert retry.wait() == 3.0
+                mock_sleep.assert_called_once_with(3.0)
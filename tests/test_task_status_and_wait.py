@@ -14,7 +14,6 @@ def test_wait_for_task_timeout_uses_monotonic(monkeypatch) -> None:
         client.wait_for_task("t1", poll_interval=0.01, max_wait=0.05)
 
 
-@pytest.mark.asyncio
 async def test_async_wait_for_task_timeout_uses_monotonic(monkeypatch) -> None:
     async with AsyncThordataClient(
         scraper_token="dummy", public_token="p", public_key="k"
@@ -47,7 +46,6 @@ def test_get_task_status_raises_on_non_200_code(httpserver: HTTPServer) -> None:
         client.get_task_status("t1")
 
 
-@pytest.mark.asyncio
 async def test_async_get_task_status_raises_on_non_200_code(
     httpserver: HTTPServer,
 ) -> None:
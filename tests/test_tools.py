@@ -1,4 +1,10 @@
-from thordata.tools import Amazon
+import dataclasses
+import sys
+
+import pytest
+
+from thordata.tools import Amazon, ToolRequest, YouTube
+from thordata.types.common import CommonSettings
 
 
 def test_amazon_product_tool():
@@ -22,3 +28,42 @@ def test_tool_integration_with_config():
     assert params["keyword"] == "laptop"
     assert "domain" in params
     assert "page_turning" in params
+
+
+def test_video_tools_share_default_common_settings():
+    first = YouTube.VideoDownload(url="https://youtu.be/a")
+    second = YouTube.AudioDownload(url="https://youtu.be/b")
+
+    assert first.common_settings is second.common_settings
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.common_settings.resolution = "1080p"  # type: ignore[misc]
+
+
+def test_spider_identifiers_are_interned():
+    spider_id = YouTube.VideoPostByUrl.SPIDER_ID
+    assert sys.intern("youtube_video-post_by-url") is spider_id
+
+
+def test_tool_requests_stay_open_for_subclassing():
+    @dataclasses.dataclass
+    class CustomTool(ToolRequest):
+        SPIDER_ID = "custom_spider"
+        SPIDER_NAME = "example.com"
+
+        keyword: str
+
+    tool = CustomTool(keyword="a")
+    tool.keyword = "b"
+    assert tool.to_task_parameters() == {"keyword": "b"}
+
+    product = Amazon.Product(asin="B08XYZ")
+    product.asin = "B09ABC"
+    assert product.to_task_parameters()["asin"] == "B09ABC"
+
+
+def test_common_settings_json_is_reused():
+    first = CommonSettings(resolution="720p", is_subtitles=True)
+    second = CommonSettings(resolution="720p", is_subtitles=True)
+
+    assert first.to_json() == '{"resolution":"720p","is_subtitles":"true"}'
+    assert first.to_json() is second.to_json()
@@ -2,11 +2,16 @@
 Tests for unlimited namespace (sync and async).
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from thordata import AsyncThordataClient, ThordataClient
+from thordata._utils import build_public_api_headers
 from thordata.exceptions import ThordataConfigError
 
 # -----------------------------------------------------------------------------
@@ -36,6 +41,194 @@ class TestUnlimitedNamespaceSync:
         assert len(out) == 1
         assert out[0]["ip"] == "1.2.3.4"
 
+    def test_list_servers_cached_until_action_or_refresh(self, client):
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+        with patch.object(
+            client, "_api_request_with_retry", return_value=mock_r
+        ) as mock_req:
+            client.unlimited.list_servers()
+            client.unlimited.list_servers()
+            assert mock_req.call_count == 1
+
+            client.unlimited.list_servers(force_refresh=True)
+            assert mock_req.call_count == 2
+
+            mock_r.json.return_value = {"code": 200, "data": {}}
+            client.unlimited.restart_server("plan1")
+            mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+            client.unlimited.list_servers()
+            assert mock_req.call_count == 4
+
+    def test_list_servers_cache_scoped_to_credentials(self, client):
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+        with patch.object(
+            client, "_api_request_with_retry", return_value=mock_r
+        ) as mock_req:
+            client.unlimited.list_servers()
+            client.public_token = "other"
+            mock_r.json.return_value = {"code": 200, "data": [{"ip": "5.6.7.8"}]}
+            out = client.unlimited.list_servers()
+        assert mock_req.call_count == 2
+        assert out == [{"ip": "5.6.7.8"}]
+        assert mock_req.call_args.kwargs["params"]["token"] == "other"
+
+    def test_cached_listing_entries_not_shared(self, client):
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+        with patch.object(client, "_api_request_with_retry", return_value=mock_r):
+            client.unlimited.list_servers()[0]["ip"] = "mutated"
+            assert client.unlimited.list_servers()[0]["ip"] == "1.2.3.4"
+
+            mock_r.json.return_value = {"code": 200, "data": {"list": [{"u": "1"}]}}
+            client.unlimited.list_bound_users("1.2.3.4")[0]["u"] = "mutated"
+            assert client.unlimited.list_bound_users("1.2.3.4") == [{"u": "1"}]
+
+    def test_fetch_straddling_clear_not_cached(self, client):
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+
+        def request(*args, **kwargs):
+            # An action elsewhere clears the cache while this fetch is running
+            client.unlimited._cache.clear()
+            return mock_r
+
+        with patch.object(
+            client, "_api_request_with_retry", side_effect=request
+        ) as mock_req:
+            client.unlimited.list_servers()
+            client.unlimited.list_bound_users("1.2.3.4")
+            assert mock_req.call_count == 2
+
+            mock_req.side_effect = None
+            mock_req.return_value = mock_r
+            client.unlimited.list_servers()
+            client.unlimited.list_bound_users("1.2.3.4")
+            assert mock_req.call_count == 4
+
+    def test_list_servers_cache_disabled_with_zero_ttl(self):
+        client = ThordataClient(
+            scraper_token="st", public_token="pt", public_key="pk", cache_ttl=0
+        )
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+        with patch.object(
+            client, "_api_request_with_retry", return_value=mock_r
+        ) as mock_req:
+            client.unlimited.list_servers()
+            client.unlimited.list_servers()
+        assert mock_req.call_count == 2
+
+    def test_concurrent_list_servers_share_one_request(self):
+        client = ThordataClient(
+            scraper_token="st", public_token="pt", public_key="pk", cache_ttl=0
+        )
+        started = threading.Event()
+        release = threading.Event()
+        mock_r = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": [{"ip": "1.2.3.4"}]}
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return mock_r
+
+        with (
+            patch.object(
+                client, "_api_request_with_retry", side_effect=slow_request
+            ) as mock_req,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            first = pool.submit(client.unlimited.list_servers)
+            started.wait(5)
+            others = [pool.submit(client.unlimited.list_servers) for _ in range(3)]
+            time.sleep(0.2)  # let the other callers join the in-flight call
+            release.set()
+            results = [f.result() for f in [first, *others]]
+        assert mock_req.call_count == 1
+        assert all(r == [{"ip": "1.2.3.4"}] for r in results)
+        assert results[0] is not results[1]
+
+    def test_list_bound_users_batch(self, client):
+        def fake_post(endpoint, payload):
+            return {"list": [{"username": "u-" + payload["ip"]}]}
+
+        with patch.object(
+            client.unlimited, "_post_action", side_effect=fake_post
+        ) as mock_post:
+            out = client.unlimited.list_bound_users_batch(
+                ["1.2.3.4", "5.6.7.8"], concurrency=2
+            )
+        assert mock_post.call_count == 2
+        assert list(out) == ["1.2.3.4", "5.6.7.8"]
+        assert out["5.6.7.8"] == [{"username": "u-5.6.7.8"}]
+
+    def test_bind_users_batch(self, client):
+        def fake_post(endpoint, payload):
+            if payload["username"] == "bad":
+                raise ValueError("boom")
+            return {"bound": payload["username"]}
+
+        with patch.object(
+            client.unlimited, "_post_action", side_effect=fake_post
+        ) as mock_post:
+            out = client.unlimited.bind_users_batch(
+                [("1.2.3.4", "u1"), ("1.2.3.4", "bad"), ("5.6.7.8", "u2")],
+                concurrency=2,
+            )
+        assert mock_post.call_count == 3
+        assert [r["index"] for r in out] == [0, 1, 2]
+        assert out[0]["ok"] is True and out[0]["output"] == {"bound": "u1"}
+        assert out[1]["ok"] is False and out[1]["error"]["type"] == "ValueError"
+        assert out[2]["ip"] == "5.6.7.8"
+
+    def test_batch_posts_all_carry_auth_headers(self, client):
+        mock_r = MagicMock()
+        mock_r.status_code = 200
+        mock_r.raise_for_status = MagicMock()
+        mock_r.json.return_value = {"code": 200, "data": {}}
+        sent = []
+
+        def fake_request(method, url, *, data=None, headers=None, params=None):
+            sent.append(headers)
+            return mock_r
+
+        def slow_headers(token, key):
+            # Widen the window in which other workers could see half-built state
+            time.sleep(0.01)
+            return build_public_api_headers(token, key)
+
+        with (
+            patch.object(client, "_api_request_with_retry", side_effect=fake_request),
+            patch("thordata.unlimited.build_public_api_headers", slow_headers),
+        ):
+            out = client.unlimited.bind_users_batch(
+                [("1.2.3.4", f"u{i}") for i in range(16)], concurrency=8
+            )
+        assert all(r["ok"] for r in out)
+        assert len(sent) == 16
+        assert all(h["token"] == "pt" and h["key"] == "pk" for h in sent)
+
+    def test_endpoint_urls_precomputed(self, client):
+        urls = client.unlimited._urls
+        assert urls["/unlimited/server-list"] == (
+            client._api_base + "/unlimited/server-list"
+        )
+        assert "/add_unlimited_servers_bind_user" in urls
+        with pytest.raises(TypeError):
+            urls["/unlimited/renew"] = "x"  # type: ignore[index]
+
     def test_list_servers_requires_public_credentials(self):
         client = ThordataClient(scraper_token="st")
         with pytest.raises(ThordataConfigError):
@@ -87,6 +280,16 @@ class TestUnlimitedNamespaceSync:
             out = client.unlimited.bind_user("1.2.3.4", "user1")
         assert isinstance(out, dict)
 
+    def test_post_headers_reused_until_credentials_change(self, client):
+        first = client.unlimited._public_headers()
+        assert client.unlimited._public_headers() is first
+        assert first["token"] == "pt"
+
+        client.public_token = "pt2"
+        second = client.unlimited._public_headers()
+        assert second is not first
+        assert second["token"] == "pt2"
+
     def test_unbind_user_success(self, client):
         mock_r = MagicMock()
         mock_r.status_code = 200
@@ -123,7 +326,6 @@ def _make_async_session_for_get_post(get_json, post_json):
     return session
 
 
-@pytest.mark.asyncio
 async def test_async_unlimited_list_servers_success():
     client = AsyncThordataClient(
         scraper_token="st",
@@ -144,7 +346,6 @@ async def test_async_unlimited_list_servers_success():
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_async_unlimited_restart_server_success():
     client = AsyncThordataClient(
         scraper_token="st",
@@ -164,7 +365,6 @@ async def test_async_unlimited_restart_server_success():
         await client.close()
 
 
-@pytest.mark.asyncio
 async def test_async_unlimited_renew_success():
     client = AsyncThordataClient(
         scraper_token="st",
@@ -182,3 +382,110 @@ async def test_async_unlimited_renew_success():
         assert out["plan_name"] == "plan1"
     finally:
         await client.close()
+
+
+async def test_async_unlimited_bind_users_batch():
+    client = AsyncThordataClient(
+        scraper_token="st",
+        public_token="pt",
+        public_key="pk",
+    )
+
+    async def fake_post(endpoint, payload):
+        if payload["username"] == "bad":
+            raise ValueError("boom")
+        return {"bound": payload["username"]}
+
+    try:
+        with patch.object(client.unlimited, "_post_action", side_effect=fake_post):
+            out = await client.unlimited.bind_users_batch(
+                [("1.2.3.4", "u1"), ("1.2.3.4", "bad"), ("5.6.7.8", "u2")],
+                concurrency=2,
+            )
+        assert [r["index"] for r in out] == [0, 1, 2]
+        assert out[0]["ok"] is True and out[0]["output"] == {"bound": "u1"}
+        assert out[1]["ok"] is False and out[1]["error"]["type"] == "ValueError"
+        assert out[2]["ip"] == "5.6.7.8"
+    finally:
+        await client.close()
+
+
+async def test_async_unlimited_concurrent_list_servers_share_one_request():
+    client = AsyncThordataClient(
+        scraper_token="st",
+        public_token="pt",
+        public_key="pk",
+        cache_ttl=0,
+    )
+    calls = 0
+
+    async def fake_fetch(key):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"ip": "5.6.7.8"}]
+
+    try:
+        with patch.object(client.unlimited, "_fetch_servers", side_effect=fake_fetch):
+            results = await asyncio.gather(
+                *(client.unlimited.list_servers() for _ in range(5))
+            )
+        assert calls == 1
+        assert all(r == [{"ip": "5.6.7.8"}] for r in results)
+    finally:
+        await client.close()
+
+
+async def test_async_unlimited_list_bound_users_batch():
+    client = AsyncThordataClient(
+        scraper_token="st",
+        public_token="pt",
+        public_key="pk",
+    )
+
+    async def fake_post(endpoint, payload):
+        return {"list": [{"username": "u-" + payload["ip"]}]}
+
+    try:
+        with patch.object(client.unlimited, "_post_action", side_effect=fake_post):
+            out = await client.unlimited.list_bound_users_batch(
+                ["1.2.3.4", "5.6.7.8"], concurrency=1
+            )
+        assert list(out) == ["1.2.3.4", "5.6.7.8"]
+        assert out["1.2.3.4"] == [{"username": "u-1.2.3.4"}]
+    finally:
+        await client.close()
+
+
+async def test_async_unlimited_run_actions_batch():
+    client = AsyncThordataClient(
+        scraper_token="st",
+        public_token="pt",
+        public_key="pk",
+    )
+
+    async def fake_post(endpoint, payload):
+        return {"endpoint": endpoint, **payload}
+
+    try:
+        with patch.object(client.unlimited, "_post_action", side_effect=fake_post):
+            out = await client.unlimited.run_actions_batch(
+                [
+                    {
+                        "action": "bind_user",
+                        "params": {"ip": "1.2.3.4", "username": "u1"},
+                    },
+                    {"action": "restart_server", "params": {"plan_name": "p1"}},
+                    {"action": "close", "params": {}},
+                    {"action": "renew", "params": {"plan_name": "p1"}},
+                ],
+                concurrency=2,
+            )
+        assert [r["index"] for r in out] == [0, 1, 2, 3]
+        assert out[0]["ok"] is True and out[0]["output"]["username"] == "u1"
+        assert out[1]["output"]["endpoint"] == "/unlimited/restart-server"
+        assert out[2]["ok"] is False
+        assert out[2]["error"]["type"] == "validation_error"
+        assert out[3]["ok"] is False and out[3]["error"]["type"] == "TypeError"
+    finally:
+        await client.close()
@@ -1,4 +1,3 @@
-import pytest
 from pytest_httpserver import HTTPServer
 from werkzeug.wrappers import Request, Response
 
@@ -20,7 +19,6 @@ def test_sync_user_agent_is_sent(httpserver: HTTPServer) -> None:
     client.serp_search("python", num=1)
 
 
-@pytest.mark.asyncio
 async def test_async_user_agent_is_sent(httpserver: HTTPServer) -> None:
     def handler(request: Request) -> Response:
         ua = request.headers.get("User-Agent", "")
@@ -3,6 +3,7 @@ Tests for thordata._utils module (internal utilities).
 """
 
 import base64
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -52,6 +53,22 @@ class TestDecodeBase64Image:
             _utils.decode_base64_image("not-valid-base64!!!")
 
 
+class TestResponseJson:
+    @pytest.mark.skipif(_utils._orjson is None, reason="orjson not installed")
+    def test_decodes_raw_bytes(self):
+        response = SimpleNamespace(content=b'{"code": 200, "data": [1]}')
+        assert _utils.response_json(response) == {"code": 200, "data": [1]}
+
+    def test_falls_back_to_response_json(self):
+        response = SimpleNamespace(content=None, json=lambda: {"code": 200})
+        assert _utils.response_json(response) == {"code": 200}
+
+    def test_falls_back_without_orjson(self):
+        response = SimpleNamespace(content=b"{}", json=lambda: {"code": 200})
+        with patch.object(_utils, "_orjson", None):
+            assert _utils.response_json(response) == {"code": 200}
+
+
 class TestBuildAuthHeaders:
     def test_bearer_mode(self):
         h = _utils.build_auth_headers("my_token", mode="bearer")